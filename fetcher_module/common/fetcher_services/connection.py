@@ -65,7 +65,9 @@ def create_connection(config: Dict[str, Any]) -> Tuple[Optional[fsspec.AbstractF
                 fs = s3fs.S3FileSystem(
                     key=config['aws_access_key_id'],
                     secret=config['aws_secret_access_key'],
-                    client_kwargs={'region_name': config.get('region', 'us-east-1')}
+                    client_kwargs={'region_name': config.get('region', 'us-east-1')},
+                    # Enough pooled connections for parallel ranged downloads (botocore default is 10)
+                    config_kwargs={'max_pool_connections': max(10, config.get('max_concurrency') or 10)}
                 )
                 
                 # Test connection by listing bucket contents
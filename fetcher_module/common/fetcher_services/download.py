@@ -20,7 +20,44 @@ from .connection import create_connection
 
 logger = logging.getLogger(__name__)
 
-def download_file(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: str) -> bool:
+def _local_file_size(path: str) -> Optional[int]:
+    """Return the size of a local file with a single stat, or None if it does not exist."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+def _download_ranges(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: str,
+                     size: int, chunksize: int, max_concurrency: int) -> None:
+    """
+    Download a file as byte ranges fetched concurrently.
+    
+    Ranges are requested max_concurrency at a time through fs.cat_ranges (which
+    async filesystems such as s3fs run in parallel) and written in order, so at most
+    max_concurrency * chunksize bytes are held in memory.
+    """
+    starts = list(range(0, size, chunksize))
+    ends = [min(start + chunksize, size) for start in starts]
+    
+    try:
+        with open(local_path, 'wb') as f:
+            for batch in range(0, len(starts), max_concurrency):
+                batch_starts = starts[batch:batch + max_concurrency]
+                batch_ends = ends[batch:batch + max_concurrency]
+                parts = fs.cat_ranges([remote_path] * len(batch_starts), batch_starts, batch_ends)
+                for part in parts:
+                    if isinstance(part, Exception):
+                        raise part
+                    f.write(part)
+    except Exception:
+        # Don't leave a truncated file behind to be mistaken for a finished download
+        if os.path.exists(local_path):
+            os.remove(local_path)
+        raise
+
+def download_file(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: str,
+                  size: Optional[int] = None, chunksize: Optional[int] = None,
+                  max_concurrency: int = 1) -> bool:
     """
     Download a single file from remote to local path.
     
@@ -28,6 +65,9 @@ def download_file(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: s
         fs: fsspec filesystem object
         remote_path: Path to the file on the remote system
         local_path: Local path where the file should be saved
+        size: Remote file size in bytes, if known
+        chunksize: Files larger than this are downloaded as concurrent byte ranges
+        max_concurrency: Number of byte ranges requested at once (1 disables ranged downloads)
         
     Returns:
         True if download was successful, False otherwise
@@ -48,7 +88,11 @@ def download_file(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: s
         start_time = time.time()
         
         try:
-            fs.get(remote_path, local_path)
+            if size and chunksize and max_concurrency > 1 and size > chunksize:
+                logger.info(f"Downloading in {-(-size // chunksize)} ranges, {max_concurrency} at a time")
+                _download_ranges(fs, remote_path, local_path, size, chunksize, max_concurrency)
+            else:
+                fs.get(remote_path, local_path)
         except Exception as e:
             # Handle S3-specific errors
             if BOTOCORE_AVAILABLE and isinstance(e, botocore.exceptions.ClientError):
@@ -69,8 +113,8 @@ def download_file(fs: fsspec.AbstractFileSystem, remote_path: str, local_path: s
         elapsed = time.time() - start_time
         
         # Verify the download
-        if os.path.exists(local_path):
-            size = os.path.getsize(local_path)
+        size = _local_file_size(local_path)
+        if size is not None:
             transfer_rate = size / elapsed if elapsed > 0 else 0
             logger.info(f"DOWNLOAD SUCCESS: {remote_path} ({format_file_size(size)})")
             logger.info(f"  Time: {elapsed:.2f} seconds")
@@ -115,6 +159,13 @@ def download_files(fs: fsspec.AbstractFileSystem, files: List[Dict[str, Any]],
     max_retries = config.get('max_reconnect_attempts', 3)
     retry_delay = config.get('reconnect_delay_seconds', 5)
     
+    # Large S3 objects are fetched as concurrent byte ranges
+    if config.get('type') == 's3':
+        chunksize = config.get('chunksize')
+        max_concurrency = config.get('max_concurrency') or 10
+    else:
+        chunksize, max_concurrency = None, 1
+    
     logger.info(f"Starting download: {len(files)} files to {local_path}")
     
     # Check for existing state
@@ -174,8 +225,8 @@ def download_files(fs: fsspec.AbstractFileSystem, files: List[Dict[str, Any]],
         logger.info(f"[{i+1}/{len(files)}] {file_name} ({format_file_size(file_info['size'])})")
         
         # Check if file already exists locally
-        if os.path.exists(local_file_path):
-            local_size = os.path.getsize(local_file_path)
+        local_size = _local_file_size(local_file_path)
+        if local_size is not None:
             if not overwrite:
                 logger.info(f"SKIPPED: {file_name} (exists)")
                 skipped_count += 1
@@ -200,10 +251,10 @@ def download_files(fs: fsspec.AbstractFileSystem, files: List[Dict[str, Any]],
             
             try:
                 # Download the file
-                if download_file(fs, remote_path, local_file_path):
+                if download_file(fs, remote_path, local_file_path, file_info.get('size'), chunksize, max_concurrency):
                     # Check file size after download
-                    if os.path.exists(local_file_path):
-                        local_size = os.path.getsize(local_file_path)
+                    local_size = _local_file_size(local_file_path)
+                    if local_size is not None:
                         remote_size = file_info['size']
                         
                         if local_size == remote_size:
@@ -8,7 +8,7 @@ import datetime
 import os
 from typing import Dict, List, Any, Optional
 
-from .utils import parse_size, format_date_placeholders, prepare_regex_pattern
+from .utils import parse_size, format_date_placeholders, prepare_regex_pattern, parse_date
 
 logger = logging.getLogger(__name__)
 
@@ -297,7 +297,7 @@ def filter_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Di
                     if match:
                         try:
                             date_str = match.group(0)
-                            extracted_date = datetime.datetime.strptime(date_str, date_format)
+                            extracted_date = parse_date(date_str, date_format)
                         except ValueError:
                             pass
                 
@@ -311,7 +311,7 @@ def filter_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Di
                     if match:
                         try:
                             date_str = match.group(0)
-                            extracted_date = datetime.datetime.strptime(date_str, date_format)
+                            extracted_date = parse_date(date_str, date_format)
                         except ValueError:
                             pass
                 
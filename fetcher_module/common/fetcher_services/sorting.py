@@ -5,9 +5,12 @@ File sorting service.
 import logging
 import re
 import os
-import datetime
+import heapq
+from operator import itemgetter
 from typing import Dict, List, Any, Callable, Optional
 
+from .utils import parse_date
+
 def to_naive_datetime(dt):
     """Convert datetime to naive (no timezone) for comparison."""
     if dt and hasattr(dt, 'tzinfo') and dt.tzinfo:
@@ -18,6 +21,75 @@ def to_naive_datetime(dt):
 
 logger = logging.getLogger(__name__)
 
+# Date patterns compiled from strptime formats, keyed by (format, 'filename'|'path').
+# Shared across sort_files calls so each format is translated once per process.
+_COMPILED_DATE_PATTERNS: Dict[tuple, Optional[re.Pattern]] = {}
+
+def get_dir_path(file: Dict[str, Any]) -> str:
+    """Return the directory part of a file's path, cached on the file dict."""
+    dir_path = file.get('_dir')
+    if dir_path is None:
+        dir_path = os.path.dirname(file.get('path', file['name']))
+        file['_dir'] = dir_path
+    return dir_path
+
+def _compile_date_format(date_format: str, month_names: bool = False) -> Optional[re.Pattern]:
+    """
+    Convert a strptime format into a compiled regex that finds the date in a string.
+
+    Args:
+        date_format: strptime format (e.g., '%Y-%m-%d')
+        month_names: Also translate %b/%B (used for directory paths)
+
+    Returns:
+        Compiled pattern, or None if the format does not yield a valid regex
+    """
+    cache_key = (date_format, 'path' if month_names else 'filename')
+    if cache_key in _COMPILED_DATE_PATTERNS:
+        return _COMPILED_DATE_PATTERNS[cache_key]
+
+    regex_pattern = date_format
+    regex_pattern = regex_pattern.replace('%Y', r'(\d{4})')
+    regex_pattern = regex_pattern.replace('%y', r'(\d{2})')
+    regex_pattern = regex_pattern.replace('%m', r'(\d{1,2})')
+    regex_pattern = regex_pattern.replace('%d', r'(\d{1,2})')
+    if month_names:
+        regex_pattern = regex_pattern.replace('%b', r'([A-Z]{3})')
+        regex_pattern = regex_pattern.replace('%B', r'([A-Za-z]+)')
+    regex_pattern = regex_pattern.replace('%H', r'(\d{1,2})')
+    regex_pattern = regex_pattern.replace('%M', r'(\d{1,2})')
+    regex_pattern = regex_pattern.replace('%S', r'(\d{1,2})')
+    try:
+        compiled = re.compile(regex_pattern)
+    except re.error as e:
+        logger.debug(f"Could not build date pattern from format {date_format}: {e}")
+        compiled = None
+    _COMPILED_DATE_PATTERNS[cache_key] = compiled
+    return compiled
+
+def _first_matching_pattern(patterns: List[tuple], text: str) -> Optional[tuple]:
+    """
+    Return the first (format, compiled) pair, in priority order, whose pattern
+    occurs anywhere in text, or None if none does.
+    """
+    for fmt, compiled in patterns:
+        if compiled.search(text):
+            return fmt, compiled
+    return None
+
+def _sort_by_key(items: List[Dict[str, Any]], key: Callable, reverse: bool,
+                 top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Sort items by key, selecting only the first top_k when that is a small slice.
+
+    heapq.nsmallest/nlargest give the same (stable) order as a full sort followed
+    by [:top_k], in O(N log k) instead of O(N log N).
+    """
+    if top_k and 0 < top_k < len(items) // 4:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        return select(top_k, items, key=key)
+    return sorted(items, key=key, reverse=reverse)
+
 def detect_date_location(files: List[Dict[str, Any]], config: Dict[str, Any]) -> Dict[str, Any]:
     """
     Auto-detect whether dates are in filenames or paths when user requests sorting by date
@@ -47,74 +119,56 @@ def detect_date_location(files: List[Dict[str, Any]], config: Dict[str, Any]) ->
         filename_formats = [user_format] if user_format else ['%Y-%m-%d', '%Y%m%d', '%d-%m-%Y', '%Y_%m_%d']
         path_formats = [user_format] if user_format else ['%Y/%m/%d', '%Y/%b/%d', '%Y-%m-%d']
         
+        # Compile each candidate format once, skipping any that do not form a valid regex
+        filename_patterns = [(fmt, _compile_date_format(fmt)) for fmt in filename_formats]
+        filename_patterns = [(fmt, compiled) for fmt, compiled in filename_patterns if compiled]
+        path_patterns = [(fmt, _compile_date_format(fmt, month_names=True)) for fmt in path_formats]
+        path_patterns = [(fmt, compiled) for fmt, compiled in path_patterns if compiled]
+
         # Count successful date extractions from filenames
         filename_matches = 0
         best_filename_format = None
+        best_filename_re = None
         for file in sample_files:
-            for fmt in filename_formats:
-                try:
-                    # Convert format to regex pattern
-                    regex_pattern = fmt
-                    regex_pattern = regex_pattern.replace('%Y', r'(\d{4})')
-                    regex_pattern = regex_pattern.replace('%y', r'(\d{2})')
-                    regex_pattern = regex_pattern.replace('%m', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%d', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%H', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%M', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%S', r'(\d{1,2})')
-                    
-                    # Find date pattern in filename (just the basename, not the full path)
-                    if re.search(regex_pattern, file['name']):
-                        filename_matches += 1
-                        best_filename_format = fmt
-                        break
-                except Exception:
-                    continue
-        
+            # Find date pattern in filename (just the basename, not the full path)
+            match = _first_matching_pattern(filename_patterns, file['name'])
+            if match:
+                filename_matches += 1
+                best_filename_format, best_filename_re = match
+
         # Count successful date extractions from paths
         path_matches = 0
         best_path_format = None
+        best_path_re = None
         for file in sample_files:
             # Get the directory part of the path, excluding the filename
             file_path = file.get('path', '')
             if not file_path or file_path == file['name']:
                 # If there's no separate path or path is same as filename, skip
                 continue
-                
+
             # Remove the filename from the path to ensure we're only checking the directory part
-            dir_path = os.path.dirname(file_path)
-            
-            for fmt in path_formats:
-                try:
-                    # Convert format to regex pattern
-                    regex_pattern = fmt
-                    regex_pattern = regex_pattern.replace('%Y', r'(\d{4})')
-                    regex_pattern = regex_pattern.replace('%y', r'(\d{2})')
-                    regex_pattern = regex_pattern.replace('%m', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%d', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%b', r'([A-Z]{3})')
-                    regex_pattern = regex_pattern.replace('%B', r'([A-Za-z]+)')
-                    regex_pattern = regex_pattern.replace('%H', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%M', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%S', r'(\d{1,2})')
-                    
-                    # Find date pattern in directory path only
-                    if re.search(regex_pattern, dir_path):
-                        path_matches += 1
-                        best_path_format = fmt
-                        break
-                except Exception:
-                    continue
-        
+            dir_path = get_dir_path(file)
+
+            # Find date pattern in directory path only
+            match = _first_matching_pattern(path_patterns, dir_path)
+            if match:
+                path_matches += 1
+                best_path_format, best_path_re = match
+
         # Determine best location based on match counts
         if filename_matches > path_matches:
             logger.info(f"Auto-detected dates in filenames ({filename_matches}/{sample_size} matches)")
             config['sortByDateInFilename'] = True
             config['dateFormatInFilename'] = best_filename_format or '%Y-%m-%d'  # Use detected format or default
+            if best_filename_re is not None:
+                config['_compiled_filename_date_re'] = best_filename_re
         elif path_matches > 0:
             logger.info(f"Auto-detected dates in directory paths ({path_matches}/{sample_size} matches)")
             config['sortByDateInPath'] = True
             config['dateFormatInPath'] = best_path_format or '%Y/%m/%d'  # Use detected format or default
+            if best_path_re is not None:
+                config['_compiled_path_date_re'] = best_path_re
         else:
             logger.info("Could not auto-detect dates in filenames or directory paths, defaulting to filename sorting")
             config['sortOnFileName'] = True
@@ -160,6 +214,10 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
             config = detect_date_location(files, config)
     
     logger.info(f"Sorting {len(files)} files")
+
+    # Only the first num_files results are kept, so sorts can select just those
+    num_files = config.get('num_files')
+    top_k = num_files if not config.get('getLatestFileOnly') and num_files and num_files > 0 else None
     
     print(f"🔍 CHECKING SORTING CONDITIONS:")
     print(f"   sortFilesByModifiedTime: {config.get('sortFilesByModifiedTime')}")
@@ -182,7 +240,7 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
             for file in sorted_files[:5]:
                 logger.debug(f"  {file['name']} - {file['mtime']} ({file['mtime'].timestamp()})")
             
-            sorted_files.sort(key=lambda x: x['mtime'], reverse=reverse)
+            sorted_files = _sort_by_key(sorted_files, itemgetter('mtime'), reverse, top_k)
             
             # Debug: log after sorting
             logger.debug("Files after sorting:")
@@ -210,54 +268,38 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
         logger.info(f"Sorting files by date in path using format: {date_format} ({'descending' if reverse else 'ascending'})")
         
         try:
-            def extract_date_from_path(file_path):
+            # Reuse the pattern compiled during auto-detection when available
+            compiled = config.get('_compiled_path_date_re') or _compile_date_format(date_format, month_names=True)
+
+            def extract_date_from_path(file):
                 """Extract date from file path using the specified format."""
                 try:
                     # Get the directory part of the path, excluding the filename
-                    dir_path = os.path.dirname(file_path)
-                    
-                    # Convert strptime format to regex pattern
-                    regex_pattern = date_format
-                    regex_pattern = regex_pattern.replace('%Y', r'(\d{4})')
-                    regex_pattern = regex_pattern.replace('%y', r'(\d{2})')
-                    regex_pattern = regex_pattern.replace('%m', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%d', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%b', r'([A-Z]{3})')
-                    regex_pattern = regex_pattern.replace('%B', r'([A-Za-z]+)')
-                    regex_pattern = regex_pattern.replace('%H', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%M', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%S', r'(\d{1,2})')
-                    
+                    dir_path = get_dir_path(file)
+
                     # Find date pattern in directory path only
-                    match = re.search(regex_pattern, dir_path)
+                    match = compiled.search(dir_path) if compiled else None
                     if match:
                         # Extract the matched date string
                         date_str = match.group(0)
-                        # Parse using the original format
-                        return datetime.datetime.strptime(date_str, date_format)
+                        # Parse using the original format and record it for sorting
+                        file['extracted_path_date'] = parse_date(date_str, date_format)
+                        return file['extracted_path_date']
                     return None
                 except Exception as e:
-                    logger.debug(f"Could not extract date from path {file_path}: {e}")
+                    logger.debug(f"Could not extract date from path {file.get('path', file['name'])}: {e}")
                     return None
-            
-            # Extract dates and sort
-            files_with_dates = []
-            files_without_dates = []
-            
-            for file in sorted_files:
-                file_path = file.get('path', file['name'])  # Use full path if available
-                extracted_date = extract_date_from_path(file_path)
-                if extracted_date:
-                    file['extracted_path_date'] = extracted_date
-                    files_with_dates.append(file)
-                else:
-                    files_without_dates.append(file)
+
+            # Extract dates in one pass, then partition
+            dated = [(file, extract_date_from_path(file)) for file in sorted_files]
+            files_with_dates = [file for file, extracted_date in dated if extracted_date]
+            files_without_dates = [file for file, extracted_date in dated if not extracted_date]
             
             logger.info(f"Found dates in paths of {len(files_with_dates)} files, {len(files_without_dates)} files without recognizable date patterns")
             
             # Sort files with dates
             if files_with_dates:
-                files_with_dates.sort(key=lambda x: x['extracted_path_date'], reverse=reverse)
+                files_with_dates = _sort_by_key(files_with_dates, itemgetter('extracted_path_date'), reverse, top_k)
                 
                 # Log sorted order
                 logger.info("Files sorted by date in path:")
@@ -286,48 +328,35 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
         logger.info(f"Sorting files by date in filename using format: {date_format} ({'descending' if reverse else 'ascending'})")
         
         try:
-            def extract_date_from_filename(filename):
+            # Reuse the pattern compiled during auto-detection when available
+            compiled = config.get('_compiled_filename_date_re') or _compile_date_format(date_format)
+
+            def extract_date_from_filename(file):
                 """Extract date from filename using the specified format."""
                 try:
-                    # Convert strptime format to regex pattern
-                    regex_pattern = date_format
-                    regex_pattern = regex_pattern.replace('%Y', r'(\d{4})')
-                    regex_pattern = regex_pattern.replace('%y', r'(\d{2})')
-                    regex_pattern = regex_pattern.replace('%m', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%d', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%H', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%M', r'(\d{1,2})')
-                    regex_pattern = regex_pattern.replace('%S', r'(\d{1,2})')
-                    
                     # Find date pattern in filename
-                    match = re.search(regex_pattern, filename)
+                    match = compiled.search(file['name']) if compiled else None
                     if match:
                         # Extract the matched date string
                         date_str = match.group(0)
-                        # Parse using the original format
-                        return datetime.datetime.strptime(date_str, date_format)
+                        # Parse using the original format and record it for sorting
+                        file['extracted_date'] = parse_date(date_str, date_format)
+                        return file['extracted_date']
                     return None
                 except Exception as e:
-                    logger.debug(f"Could not extract date from {filename}: {e}")
+                    logger.debug(f"Could not extract date from {file['name']}: {e}")
                     return None
             
-            # Extract dates and sort
-            files_with_dates = []
-            files_without_dates = []
-            
-            for file in sorted_files:
-                extracted_date = extract_date_from_filename(file['name'])
-                if extracted_date:
-                    file['extracted_date'] = extracted_date
-                    files_with_dates.append(file)
-                else:
-                    files_without_dates.append(file)
+            # Extract dates in one pass, then partition
+            dated = [(file, extract_date_from_filename(file)) for file in sorted_files]
+            files_with_dates = [file for file, extracted_date in dated if extracted_date]
+            files_without_dates = [file for file, extracted_date in dated if not extracted_date]
             
             logger.info(f"Found dates in {len(files_with_dates)} files, {len(files_without_dates)} files without recognizable dates")
             
             # Sort files with dates
             if files_with_dates:
-                files_with_dates.sort(key=lambda x: x['extracted_date'], reverse=reverse)
+                files_with_dates = _sort_by_key(files_with_dates, itemgetter('extracted_date'), reverse, top_k)
                 
                 # Log sorted order
                 logger.info("Files sorted by date in filename:")
@@ -354,7 +383,7 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
         
         try:
             # Sort by modification time in descending order to get latest first
-            sorted_files.sort(key=lambda x: x['mtime'], reverse=True)
+            sorted_files.sort(key=itemgetter('mtime'), reverse=True)
             
             # Get only the latest file(s)
             if sorted_files:
@@ -384,9 +413,9 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
             logger.info(f"Sort direction: {'descending' if reverse else 'ascending'}")
             
             if case_sensitive:
-                sorted_files.sort(key=lambda x: x['name'], reverse=reverse)
+                sorted_files = _sort_by_key(sorted_files, itemgetter('name'), reverse, top_k)
             else:
-                sorted_files.sort(key=lambda x: x['name'].lower(), reverse=reverse)
+                sorted_files = _sort_by_key(sorted_files, lambda x: x['name'].lower(), reverse, top_k)
                 
             logger.info(f"Files sorted by filename")
             
@@ -409,7 +438,6 @@ def sort_files(files: List[Dict[str, Any]], config: Dict[str, Any]) -> List[Dict
     
     # Limit number of files if specified (skip if getLatestFileOnly is enabled)
     # This is done AFTER all filtering to ensure we get the right files
-    num_files = config.get('num_files')
     if not config.get('getLatestFileOnly') and num_files and num_files > 0 and len(sorted_files) > num_files:
         logger.info(f"Limiting to {num_files} files (from {len(sorted_files)} total)")
         sorted_files = sorted_files[:num_files]
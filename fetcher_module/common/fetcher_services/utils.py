@@ -4,30 +4,142 @@ Utility functions for formatting and parsing.
 """
 import re
 import datetime
+import functools
 import os
 import logging
+import tempfile
 from typing import Optional, Union, Any, Dict
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Regex quantifiers such as \d{2} that must survive placeholder substitution
+_REGEX_QUANT_RE = re.compile(r'\\[dswbDSWB]\{[0-9,]+\}')
+# Date placeholders such as {Y} or {Y-m-d}; never spans a protected quantifier token
+_PLACEHOLDER_RE = re.compile(r'\{([^}\x00]+)\}')
+# Tokens standing in for protected quantifiers while placeholders are substituted
+_PROTECTED_TOKEN_RE = re.compile(r'\x00P(\d+)\x00')
+# Square brackets not already preceded by a backslash
+_UNESCAPED_BRACKET_RE = re.compile(r'(?<!\\)([\[\]])')
+# Human-readable sizes such as 10KB or 1.5 MB (matched against the upper-cased string)
+_SIZE_RE = re.compile(r'([+-]?[\d.]+)\s*(KB|MB|GB|TB)?')
+_SIZE_UNITS = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+_SIZE_UNIT_NAMES = ('Bytes', 'KB', 'MB', 'GB', 'TB')
+
+# Date placeholder characters and their strftime equivalents. Windows spells the
+# no-leading-zero directives with '#' instead of '-', resolved once at import.
+_IS_WINDOWS = os.name == 'nt'
+_FORMAT_MAPPING = {
+    # Year
+    'Y': '%Y',  # 4-digit year (2025)
+    'y': '%y',  # 2-digit year (25)
+
+    # Month
+    'm': '%m',  # 2-digit month with leading zero (06)
+    'n': '%#m' if _IS_WINDOWS else '%-m',  # Month without leading zero (6)
+    'M': '%b',  # 3-letter month abbreviation (Jun)
+    'F': '%B',  # Full month name (June)
+
+    # Day
+    'd': '%d',  # 2-digit day with leading zero (02)
+    'j': '%#d' if _IS_WINDOWS else '%-d',  # Day without leading zero (2)
+    'D': '%a',  # 3-letter day abbreviation (Thu)
+    'l': '%A',  # Full day name (Thursday)
+    'S': '',    # Ordinal suffix - handled separately
+
+    # Hour
+    'H': '%H',  # 24-hour with leading zero (08)
+    'G': '%#H' if _IS_WINDOWS else '%-H',  # 24-hour without leading zero (8)
+    'h': '%I',  # 12-hour with leading zero (08)
+    'g': '%#I' if _IS_WINDOWS else '%-I',  # 12-hour without leading zero (8)
+
+    # AM/PM
+    'a': '%p',  # Lowercase am/pm - handled separately
+    'A': '%p',  # Uppercase AM/PM
+
+    # Minute and Second
+    'i': '%M',  # 2-digit minute with leading zero (05)
+    's': '%S',  # 2-digit second with leading zero (09)
+
+    # Week
+    'W': '%W',  # Week number (01-53)
+}
+
+# Compound placeholders map each character through _FORMAT_MAPPING in one translate call
+_COMPOUND_TABLE = str.maketrans(_FORMAT_MAPPING)
+
+# Ordinal suffix for each day of the month, indexed by day (index 0 is unused)
+_ORDINAL_SUFFIXES = tuple(
+    'th' if 4 <= day <= 20 or 24 <= day <= 30 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+    for day in range(32)
+)
+
+# Directory holding transfer state files; resolved once instead of on every checkpoint
+_TEMPDIR = tempfile.gettempdir()
+
+
 def parse_size(size_str: Optional[Union[str, int, float]]) -> Optional[int]:
     """Convert human-readable size string to bytes."""
     if not size_str:
         return None
         
     size_str = str(size_str).strip().upper()
-    units = {"KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
-    
-    for unit, multiplier in units.items():
-        if size_str.endswith(unit):
-            try:
-                return int(float(size_str.replace(unit, '')) * multiplier)
-            except (ValueError, TypeError):
-                return None
-    
+    match = _SIZE_RE.fullmatch(size_str)
+    try:
+        if not match:
+            # Anything else int() accepts (e.g. "1_000") is still a plain byte count
+            return int(size_str)
+
+        number, unit = match.groups()
+        if unit:
+            return int(float(number) * _SIZE_UNITS[unit])
+        return int(number)
+    except ValueError:
+        return None
+
+
+def _time_bucket(pattern_str: str) -> Optional[str]:
+    """
+    Current time truncated to the finest unit used by the pattern's placeholders.
+
+    Placeholder output can only change when this value changes, so it is used
+    to key the pattern caches. Returns None for patterns without placeholders.
+    """
+    placeholder_chars = set(''.join(_PLACEHOLDER_RE.findall(pattern_str)))
+    if not placeholder_chars:
+        return None
+    # A literal '%' in a compound placeholder can reach any strftime directive
+    if placeholder_chars & {'s', '%'}:
+        bucket_format = '%Y%m%d%H%M%S'
+    elif 'i' in placeholder_chars:
+        bucket_format = '%Y%m%d%H%M'
+    elif placeholder_chars & {'H', 'G', 'h', 'g', 'a', 'A'}:
+        bucket_format = '%Y%m%d%H'
+    else:
+        bucket_format = '%Y%m%d'
+    return datetime.datetime.now().strftime(bucket_format)
+
+
+def _format_placeholder(placeholder: str, today: datetime.datetime) -> Optional[str]:
+    """Format a single placeholder body, or return None if its strftime format is invalid."""
+    if placeholder in _FORMAT_MAPPING:
+        if placeholder == 'S':
+            # Handle ordinal suffix
+            return _ORDINAL_SUFFIXES[today.day]
+        if placeholder == 'a':
+            # Handle lowercase am/pm
+            return today.strftime('%p').lower()
+        # Use the mapping for other placeholders
+        try:
+            return today.strftime(_FORMAT_MAPPING[placeholder])
+        except ValueError:
+            return None
+
+    # For compound placeholders like 'Y-m-d', replace each character with its strftime equivalent
     try:
-        return int(size_str)
-    except (ValueError, TypeError):
+        return today.strftime(placeholder.translate(_COMPOUND_TABLE))
+    except ValueError:
         return None
 
 
@@ -35,122 +147,70 @@ def format_date_placeholders(pattern_str: Optional[str]) -> Optional[str]:
     """Replace date placeholders with actual date values."""
     if not pattern_str:
         return None
-    
+    return _format_date_placeholders(pattern_str, _time_bucket(pattern_str))
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_date_placeholders(pattern_str: str, time_bucket: Optional[str]) -> str:
+    """Cached body of format_date_placeholders; time_bucket only keys the cache."""
     today = datetime.datetime.now()
     processed_pattern = pattern_str
     
-    protected_parts = {}
-    
-    for i, match in enumerate(re.finditer(r'\\[dswbDSWB]\{[0-9,]+\}', pattern_str)):
-        token = f"__REGEX_TOKEN_{i}__"
-        protected_parts[token] = match.group(0)
-        processed_pattern = processed_pattern.replace(match.group(0), token)
-    
-    format_mapping = {
-        # Year
-        'Y': '%Y',  # 4-digit year (2025)
-        'y': '%y',  # 2-digit year (25)
-        
-        # Month
-        'm': '%m',  # 2-digit month with leading zero (06)
-        'n': '%-m',  # Month without leading zero (6) - Note: Windows uses %#m
-        'M': '%b',  # 3-letter month abbreviation (Jun)
-        'F': '%B',  # Full month name (June)
-        
-        # Day
-        'd': '%d',  # 2-digit day with leading zero (02)
-        'j': '%-d',  # Day without leading zero (2) - Note: Windows uses %#d
-        'D': '%a',  # 3-letter day abbreviation (Thu)
-        'l': '%A',  # Full day name (Thursday)
-        'S': '',    # Ordinal suffix - handled separately
-        
-        # Hour
-        'H': '%H',  # 24-hour with leading zero (08)
-        'G': '%-H',  # 24-hour without leading zero (8) - Note: Windows uses %#H
-        'h': '%I',  # 12-hour with leading zero (08)
-        'g': '%-I',  # 12-hour without leading zero (8) - Note: Windows uses %#I
-        
-        # AM/PM
-        'a': '%p',  # Lowercase am/pm - handled separately
-        'A': '%p',  # Uppercase AM/PM
-        
-        # Minute and Second
-        'i': '%M',  # 2-digit minute with leading zero (05)
-        's': '%S',  # 2-digit second with leading zero (09)
-        
-        # Week
-        'W': '%W',  # Week number (01-53)
-    }
-    
-    # Handle platform-specific format differences (Windows vs Unix)
-    if os.name == 'nt':  # Windows
-        format_mapping['n'] = '%#m'
-        format_mapping['j'] = '%#d'
-        format_mapping['G'] = '%#H'
-        format_mapping['g'] = '%#I'
-    
-    # Now find and process date placeholders
-    placeholders = re.findall(r'\{([^}]+)\}', processed_pattern)
-    
-    for placeholder in placeholders:
-        if placeholder in format_mapping:
-            if placeholder == 'S':
-                # Handle ordinal suffix
-                day = int(today.strftime('%d'))
-                if 4 <= day <= 20 or 24 <= day <= 30:
-                    suffix = 'th'
-                else:
-                    suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-                date_string = suffix
-            elif placeholder == 'a':
-                # Handle lowercase am/pm
-                date_string = today.strftime('%p').lower()
-            else:
-                # Use the mapping for other placeholders
-                try:
-                    date_string = today.strftime(format_mapping[placeholder])
-                except ValueError:
-                    # If format is invalid, skip this placeholder
-                    continue
-        else:
-            # For compound placeholders like 'Y-m-d'
-            try:
-                # Replace each character with its strftime equivalent
-                strftime_format = ''
-                for char in placeholder:
-                    if char in format_mapping:
-                        strftime_format += format_mapping[char]
-                    else:
-                        strftime_format += char
-                
-                date_string = today.strftime(strftime_format)
-            except ValueError:
-                # If format is invalid, skip this placeholder
-                continue
-                
-        processed_pattern = processed_pattern.replace(f'{{{placeholder}}}', date_string)
+    # Swap regex quantifiers for NUL-delimited tokens so their braces are not
+    # mistaken for placeholders; NUL cannot occur in a user-supplied pattern
+    protected_parts = []
+
+    def _protect(match):
+        protected_parts.append(match.group(0))
+        return f"\x00P{len(protected_parts) - 1}\x00"
+
+    processed_pattern = _REGEX_QUANT_RE.sub(_protect, processed_pattern)
     
+    # Substitute all placeholders in one pass; each distinct placeholder is formatted once
+    date_strings = {}
+
+    def _substitute(match):
+        placeholder = match.group(1)
+        if placeholder not in date_strings:
+            date_strings[placeholder] = _format_placeholder(placeholder, today)
+        date_string = date_strings[placeholder]
+        # Leave placeholders whose format is invalid untouched
+        return match.group(0) if date_string is None else date_string
+
+    processed_pattern = _PLACEHOLDER_RE.sub(_substitute, processed_pattern)
+
     # Handle special case for week number format (KW{W})
     if 'KW{W}' in processed_pattern:
         week_num = today.strftime('%W')
         processed_pattern = processed_pattern.replace('KW{W}', f'KW{week_num}')
     
     # Restore protected regex quantifiers
-    for token, original in protected_parts.items():
-        processed_pattern = processed_pattern.replace(token, original)
+    if protected_parts:
+        processed_pattern = _PROTECTED_TOKEN_RE.sub(lambda m: protected_parts[int(m.group(1))], processed_pattern)
     
     logger.info(f"Formatted pattern '{pattern_str}' to: '{processed_pattern}'")
     return processed_pattern
 
 
+@functools.lru_cache(maxsize=4096)
+def parse_date(date_str: str, date_format: str) -> datetime.datetime:
+    """
+    datetime.strptime, memoized.
+    
+    Listings repeat the same date strings (every file of a day or folder), so the
+    date extraction in filtering and sorting parses each distinct string once.
+    Invalid dates raise ValueError as strptime does (failures are not cached).
+    """
+    return datetime.datetime.strptime(date_str, date_format)
+
+
 def format_file_size(size_in_bytes: int) -> str:
     """Format file size in bytes to human-readable string."""
-    if size_in_bytes >= 1024*1024:
-        return f"{size_in_bytes / (1024*1024):.2f} MB"
-    elif size_in_bytes >= 1024:
-        return f"{size_in_bytes / 1024:.2f} KB"
-    else:
+    if size_in_bytes < 1024:
         return f"{size_in_bytes} Bytes"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit_index = min((int(size_in_bytes).bit_length() - 1) // 10, len(_SIZE_UNIT_NAMES) - 1)
+    return f"{size_in_bytes / (1 << (10 * unit_index)):.2f} {_SIZE_UNIT_NAMES[unit_index]}"
 
 
 def escape_special_characters(text: str, chars_to_escape: str) -> str:
@@ -166,15 +226,16 @@ def escape_special_characters(text: str, chars_to_escape: str) -> str:
     """
     if not text or not chars_to_escape:
         return text
-        
-    result = ""
-    for char in text:
-        if char in chars_to_escape:
-            result += '\\' + char
-        else:
-            result += char
-    
-    return result
+
+    if isinstance(chars_to_escape, list):
+        chars_to_escape = tuple(chars_to_escape)
+    return text.translate(_escape_table(chars_to_escape))
+
+
+@functools.lru_cache(maxsize=64)
+def _escape_table(chars_to_escape: Union[str, tuple]) -> Dict[int, str]:
+    """Translation table mapping each character to escape onto its backslashed form."""
+    return str.maketrans({char: '\\' + char for char in chars_to_escape if len(char) == 1})
 
 
 def prepare_regex_pattern(pattern: str, config: Dict[str, Any]) -> str:
@@ -190,55 +251,49 @@ def prepare_regex_pattern(pattern: str, config: Dict[str, Any]) -> str:
     """
     if not pattern:
         return pattern
-        
+
+    escape_chars = config.get('escapeSpecialCharacters', '')
+    if isinstance(escape_chars, list):
+        escape_chars = tuple(escape_chars)
+    dont_escape_brackets = bool(config.get('dontEscapeBrackets', False))
+    return _prepare_regex_pattern(pattern, escape_chars, dont_escape_brackets, _time_bucket(pattern))
+
+
+@functools.lru_cache(maxsize=1024)
+def _prepare_regex_pattern(pattern: str, escape_chars: Union[str, tuple], dont_escape_brackets: bool,
+                           time_bucket: Optional[str]) -> str:
+    """Cached body of prepare_regex_pattern; time_bucket only keys the cache."""
     # Process date placeholders first
     pattern = format_date_placeholders(pattern) or pattern
     
     # Handle special character escaping
-    escape_chars = config.get('escapeSpecialCharacters', '')
     if escape_chars:
         pattern = escape_special_characters(pattern, escape_chars)
         logger.debug(f"After escaping special characters: '{pattern}'")
     
     # Handle bracket escaping based on configuration
-    dont_escape_brackets = config.get('dontEscapeBrackets', False)
-    
     if not dont_escape_brackets:
         # Escape square brackets to treat them as literal characters
         # But don't escape already escaped brackets
-        processed = ""
-        i = 0
-        while i < len(pattern):
-            if pattern[i] == '\\' and i + 1 < len(pattern) and pattern[i+1] in '[]':
-                # Already escaped bracket, keep as is
-                processed += pattern[i:i+2]
-                i += 2
-            elif pattern[i] in '[]':
-                # Escape unescaped bracket
-                processed += '\\' + pattern[i]
-                i += 1
-            else:
-                # Keep other characters as is
-                processed += pattern[i]
-                i += 1
-        pattern = processed
+        pattern = _UNESCAPED_BRACKET_RE.sub(r'\\\1', pattern)
         
     logger.debug(f"Prepared regex pattern: '{pattern}'")
     return pattern
 
 
 # State management functions
+
+@functools.lru_cache(maxsize=256)
+def _state_path(instance_id: Any, channel_id: Any) -> str:
+    """Path of the transfer state file for an instance/channel pair."""
+    return os.path.join(_TEMPDIR, f"transfer_state_{instance_id}_{channel_id}.json")
+
+
 def save_state(config: Dict[str, Any], processed_files: list, remaining_files: list, 
                all_files: list = None, filtered_files: list = None) -> None:
     """Save transfer state for resuming."""
     try:
-        import json
-        import tempfile
-        
-        instance_id = config.get('instance_id', 'default')
-        channel_id = config.get('channel_id', 'default')
-        
-        state_file = os.path.join(tempfile.gettempdir(), f"transfer_state_{instance_id}_{channel_id}.json")
+        state_file = _state_path(config.get('instance_id', 'default'), config.get('channel_id', 'default'))
         
         state = {
             'processed_files': processed_files,
@@ -246,9 +301,17 @@ def save_state(config: Dict[str, Any], processed_files: list, remaining_files: l
             'timestamp': datetime.datetime.now().isoformat()
         }
         
-        with open(state_file, 'w') as f:
-            json.dump(state, f, indent=2)
-            
+        # Write to a temp file and rename over the state file so a crash
+        # mid-write never leaves a truncated state behind
+        fd, tmp_path = tempfile.mkstemp(dir=_TEMPDIR, prefix='transfer_state_', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(state))
+            os.replace(tmp_path, state_file)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
         logger.debug(f"State saved to {state_file}")
     except Exception as e:
         logger.error(f"Failed to save state: {e}")
@@ -257,17 +320,11 @@ def save_state(config: Dict[str, Any], processed_files: list, remaining_files: l
 def load_state(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """Load transfer state for resuming."""
     try:
-        import json
-        import tempfile
-        
-        instance_id = config.get('instance_id', 'default')
-        channel_id = config.get('channel_id', 'default')
-        
-        state_file = os.path.join(tempfile.gettempdir(), f"transfer_state_{instance_id}_{channel_id}.json")
+        state_file = _state_path(config.get('instance_id', 'default'), config.get('channel_id', 'default'))
         
         if os.path.exists(state_file):
-            with open(state_file, 'r') as f:
-                state = json.load(f)
+            with open(state_file, 'rb') as f:
+                state = orjson.loads(f.read())
             logger.debug(f"State loaded from {state_file}")
             return state
         
@@ -280,12 +337,7 @@ def load_state(config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
 def clear_state(config: Dict[str, Any]) -> None:
     """Clear saved transfer state."""
     try:
-        import tempfile
-        
-        instance_id = config.get('instance_id', 'default')
-        channel_id = config.get('channel_id', 'default')
-        
-        state_file = os.path.join(tempfile.gettempdir(), f"transfer_state_{instance_id}_{channel_id}.json")
+        state_file = _state_path(config.get('instance_id', 'default'), config.get('channel_id', 'default'))
         
         if os.path.exists(state_file):
             os.remove(state_file)
@@ -1,12 +1,14 @@
 """Base Module Interface - Clean Implementation with Async Support"""
 
 from abc import ABC, abstractmethod
+from collections import ChainMap
 from typing import Dict, Any, List
 import tempfile
 import os
+import shutil
 import asyncio
 
-from common.logger import StructuredLogger
+from common.logger import get_logger
 from common.s3_uploader import S3Uploader
 
 
@@ -19,9 +21,13 @@ class BaseModule(ABC):
         self.channel_number = job_config.channel_number
         self.source_type = job_config.source_type
         
+        # Config lookup order: channel → fetcher → environment
+        self._config_chain = ChainMap(job_config.channel_config, job_config.fetcher_config,
+                                      job_config.environment_config)
+        
         # Initialize components
         module_name = self._get_module_name()
-        self.logger = StructuredLogger(self.job_id, f"ch_{self.channel_number}", module_name)
+        self.logger = get_logger(self.job_id, f"ch_{self.channel_number}", module_name)
         self.s3_uploader = S3Uploader(self.job_id, f"ch_{self.channel_number}", module_name, self.logger)
         
         # Create temp directory
@@ -61,29 +67,21 @@ class BaseModule(ABC):
     
     def get_config_value(self, key: str, default=None):
         """Get config value from job_config (channel → fetcher → environment priority)"""
-        if key in self.job_config.channel_config:
-            return self.job_config.channel_config[key]
-        elif key in self.job_config.fetcher_config:
-            return self.job_config.fetcher_config[key]
-        elif key in self.job_config.environment_config:
-            return self.job_config.environment_config[key]
-        else:
-            return default
+        return self._config_chain.get(key, default)
     
     def validate_config(self) -> bool:
         """Validate required configuration fields"""
         try:
             required_fields = self._get_required_config_fields()
             
-            # TODO: Implement proper validation logic
-            # Check if all required fields are available in any config source
-            # Log missing fields and return False if any are missing
-            
-            # Simple check for now
-            for field in required_fields:
-                if self.get_config_value(field) is None:
-                    self.logger.error(f"Missing required config field: {field}")
-                    return False
+            # A field is missing if no config source has it, or the winning value is None
+            available = (self.job_config.channel_config.keys() | self.job_config.fetcher_config.keys()
+                         | self.job_config.environment_config.keys())
+            missing = [field for field in required_fields
+                       if field not in available or self._config_chain[field] is None]
+            if missing:
+                self.logger.error(f"Missing required config fields: {missing}")
+                return False
             
             self.logger.info("Configuration validation passed")
             return True
@@ -118,8 +116,8 @@ class BaseModule(ABC):
             if not upload_result.get("success"):
                 return {"success": False, "error": "Upload failed", "details": upload_result}
             
-            # Cleanup
-            self._cleanup()
+            # Cleanup (blocking tree removal runs in a worker thread, off the event loop)
+            await asyncio.to_thread(self._cleanup)
             
             return {
                 "success": True,
@@ -136,15 +134,37 @@ class BaseModule(ABC):
         try:
             valid_files = validation_result.get("valid_files", [])
             upload_folder = validation_result.get("upload_folder", "")
+            metadata = {
+                "job_id": self.job_id,
+                "channel_id": f"ch_{self.channel_number}",
+                "module_name": self._get_module_name()
+            }
+            
+            # Upload files concurrently; S3Uploader is blocking, so each upload runs in a worker thread
+            semaphore = asyncio.Semaphore(int(self.get_config_value("upload_concurrency", 16)))
             
-            # TODO: Implement actual S3 upload
-            # For each file in valid_files:
-            #   - Generate S3 key: f"{upload_folder}/{filename}"
-            #   - Call self.s3_uploader.upload_file(file_path, s3_key, metadata)
+            async def upload_one(file_path: str) -> Dict[str, Any]:
+                s3_key = f"{upload_folder}/{os.path.basename(file_path)}" if upload_folder else None
+                async with semaphore:
+                    return await asyncio.to_thread(self.s3_uploader.upload_file, file_path, s3_key, metadata)
+            
+            results = await asyncio.gather(*[upload_one(f) for f in valid_files], return_exceptions=True)
+            
+            uploaded_files = []
+            failed_files = []
+            for file_path, result in zip(valid_files, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"Upload failed for {file_path}: {str(result)}")
+                    failed_files.append(file_path)
+                elif not result.get("success"):
+                    failed_files.append(file_path)
+                else:
+                    uploaded_files.append(file_path)
             
             return {
-                "success": True,
-                "uploaded_files": valid_files,
+                "success": not failed_files,
+                "uploaded_files": uploaded_files,
+                "failed_files": failed_files,
                 "upload_folder": upload_folder
             }
             
@@ -155,7 +175,6 @@ class BaseModule(ABC):
         """Clean up temp directory"""
         try:
             if os.path.exists(self.temp_dir):
-                import shutil
                 shutil.rmtree(self.temp_dir)
         except:
             pass
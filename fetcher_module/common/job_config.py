@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from common.config_loader.env_selector import EnvironmentSelector
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobConfig:
     """Job configuration data structure"""
     job_id: str
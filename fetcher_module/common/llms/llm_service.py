@@ -1,13 +1,90 @@
 """Simplified AWS Bedrock LLM Service - Pure LLM Factory with Global Session Management"""
 
-import boto3
-from typing import List, Optional
-from langchain_aws import ChatBedrockConverse
-from langchain_core.messages import BaseMessage
-from browser_use.llm import ChatAnthropicBedrock
-from botocore.config import Config
+import asyncio
+import sys
+import threading
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List, Optional
 from ..config_loader.env_selector import EnvironmentSelector
-from ..logger import StructuredLogger
+from ..logger import get_logger
+
+# Heavy SDK imports are deferred to the methods that use them so that jobs which
+# never touch Bedrock don't pay their import cost; these are for type hints only.
+if TYPE_CHECKING:
+    from browser_use.llm import ChatAnthropicBedrock
+    from langchain_aws import ChatBedrockConverse
+    from langchain_core.messages import BaseMessage
+
+# Streamed output is written to stdout in batches of at least this many characters
+# or after this many seconds, instead of one flush per chunk
+_PRINT_FLUSH_CHARS = 256
+_PRINT_FLUSH_INTERVAL = 0.05
+
+
+def _extract_list_content(content) -> str:
+    """Extract text from list-format chunk content (Bedrock Claude format)"""
+    _str = str
+    parts = []
+    for content_item in content:
+        if isinstance(content_item, dict):
+            if content_item.get('type') == 'text':
+                parts.append(content_item.get('text', ''))
+        elif isinstance(content_item, _str):
+            parts.append(content_item)
+    return ''.join(parts)
+
+
+def _extract_str_content(content) -> str:
+    """Extract text from string-format chunk content (other providers)"""
+    return content if content else ""
+
+
+@lru_cache(maxsize=32)
+def _build_bedrock_llm(client, model_id: str, temperature: float, max_tokens: int,
+                       top_p: float, disable_streaming: bool) -> "ChatBedrockConverse":
+    """Build a ChatBedrockConverse, reused for identical client and parameters"""
+    from langchain_aws import ChatBedrockConverse
+    
+    return ChatBedrockConverse(
+        model=model_id,
+        provider="anthropic",
+        client=client,  # Use shared client
+        temperature=temperature,
+        max_tokens=max_tokens,
+        top_p=top_p,
+        disable_streaming=disable_streaming
+    )
+
+
+def _write_stdout(text: str):
+    """Write text to stdout and flush it"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
+class _OutputBuffer:
+    """Pending streamed output, due for flushing by size or time"""
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.length = 0
+        self.last_flush = time.monotonic()
+    
+    def add(self, text: str) -> bool:
+        """Buffer text and return whether the buffer is due to be flushed"""
+        self.parts.append(text)
+        self.length += len(text)
+        return (self.length >= _PRINT_FLUSH_CHARS
+                or time.monotonic() - self.last_flush >= _PRINT_FLUSH_INTERVAL)
+    
+    def drain(self) -> str:
+        """Return and clear the buffered text"""
+        text = ''.join(self.parts)
+        self.parts.clear()
+        self.length = 0
+        self.last_flush = time.monotonic()
+        return text
 
 
 class LLMService:
@@ -17,7 +94,7 @@ class LLMService:
     Features:
     - Global singleton session/client management for resource efficiency
     - Environment-based AWS configuration loading
-    - Fresh LLM instance creation with customizable parameters
+    - Cached LLM instance creation with customizable parameters
     - Support for both standard Bedrock and browser-use compatible LLMs
     """
     
@@ -27,6 +104,8 @@ class LLMService:
     _aws_profile = None
     _aws_region = None
     _initialized = False
+    _init_lock = threading.Lock()
+    _env_config = None  # Loaded once, kept across resets unless explicitly reloaded
     
     def __init__(self, session_id: str = None):
         """
@@ -35,59 +114,81 @@ class LLMService:
         Args:
             session_id: Optional session identifier for logging context
         """
-        self.logger = StructuredLogger(
+        self.logger = get_logger(
             "system", 
             "llm", 
             f"llm_service_{session_id}" if session_id else "llm_service"
         )
         
-        # Initialize global resources if not already done
+        # Initialize global resources if not already done (re-checked under the lock)
         if not LLMService._initialized:
-            self._initialize_global_resources()
+            LLMService._initialize_global_resources()
     
     @classmethod
     def _initialize_global_resources(cls):
         """
         Initialize global AWS resources (session and client) that will be shared
         across all LLMService instances for efficiency.
+        
+        Thread-safe: concurrent first-time callers wait on a class lock and only
+        one of them builds the session and client. Class state is only updated
+        once everything has been created, so a failed attempt can be retried.
         """
-        try:
-            # Load environment configuration
-            env_selector = EnvironmentSelector()
-            env_config = env_selector.load_config()
-            
-            # Extract AWS configuration from environment config
-            aws_config = env_config.get("AWSBEDROCK", {})
-            cls._aws_profile = aws_config.get("profile", "default")
-            cls._aws_region = aws_config.get("region", "us-east-1")
-            
-            # Create shared boto3 session
-            cls._shared_boto3_session = boto3.Session(profile_name=cls._aws_profile)
-            
-            # Configure Bedrock client with extended timeouts for long operations
-            bedrock_config = Config(
-                read_timeout=600,  # 10 minutes read timeout
-                connect_timeout=60,  # 1 minute connect timeout
-                retries={'max_attempts': 3}
-            )
-            
-            # Create shared Bedrock client
-            cls._shared_bedrock_client = cls._shared_boto3_session.client(
-                service_name='bedrock-runtime',
-                region_name=cls._aws_region,
-                config=bedrock_config
-            )
+        with cls._init_lock:
+            if cls._initialized:
+                return
             
-            cls._initialized = True
-            
-            # Log initialization success (using a temporary logger since instance logger may not exist yet)
-            temp_logger = StructuredLogger("system", "llm", "initialization")
-            temp_logger.info(f"Initialized global LLM resources - Profile: {cls._aws_profile}, Region: {cls._aws_region}")
-            
-        except Exception as e:
-            temp_logger = StructuredLogger("system", "llm", "initialization")
-            temp_logger.error(f"Failed to initialize global LLM resources: {str(e)}")
-            raise
+            try:
+                import boto3
+                from botocore.config import Config
+                
+                # Load environment configuration (cached on the class)
+                if cls._env_config is None:
+                    cls._env_config = EnvironmentSelector().load_config()
+                env_config = cls._env_config
+                
+                # Extract AWS configuration from environment config
+                aws_config = env_config.get("AWSBEDROCK", {})
+                aws_profile = aws_config.get("profile", "default")
+                aws_region = aws_config.get("region", "us-east-1")
+                
+                # Create shared boto3 session
+                boto3_session = boto3.Session(profile_name=aws_profile)
+                
+                # Configure Bedrock client with extended timeouts for long operations,
+                # a larger warm connection pool and adaptive retries
+                bedrock_config = Config(
+                    read_timeout=600,  # 10 minutes read timeout
+                    connect_timeout=60,  # 1 minute connect timeout
+                    retries={
+                        'max_attempts': aws_config.get("max_attempts", 3),
+                        'mode': aws_config.get("retry_mode", "adaptive")
+                    },
+                    max_pool_connections=aws_config.get("max_pool_connections", 64),
+                    tcp_keepalive=aws_config.get("tcp_keepalive", True)
+                )
+                
+                # Create shared Bedrock client
+                bedrock_client = boto3_session.client(
+                    service_name='bedrock-runtime',
+                    region_name=aws_region,
+                    config=bedrock_config
+                )
+                
+                cls._aws_profile = aws_profile
+                cls._aws_region = aws_region
+                cls._shared_boto3_session = boto3_session
+                cls._shared_bedrock_client = bedrock_client
+                cls._initialized = True
+                
+                # Log initialization success (using a temporary logger since instance logger may not exist yet)
+                temp_logger = get_logger("system", "llm", "initialization")
+                temp_logger.info(f"Initialized global LLM resources - Profile: {cls._aws_profile}, Region: {cls._aws_region}")
+                
+            except Exception as e:
+                temp_logger = get_logger("system", "llm", "initialization")
+                temp_logger.error(f"Failed to initialize global LLM resources: {str(e)}")
+                raise
     
     def create_bedrock_llm(
         self,
@@ -96,9 +197,10 @@ class LLMService:
         max_tokens: int = 25000,
         top_p: float = 0.9,
         disable_streaming: bool = False
-    ) -> ChatBedrockConverse:
+    ) -> "ChatBedrockConverse":
         """
-        Create a fresh ChatBedrockConverse instance with specified parameters.
+        Get a ChatBedrockConverse instance with specified parameters. Instances are
+        cached per parameter set and shared, since they only wrap the shared client.
         
         Args:
             model_id: Bedrock model identifier
@@ -108,17 +210,16 @@ class LLMService:
             disable_streaming: Whether to disable streaming responses
             
         Returns:
-            ChatBedrockConverse: Fresh LLM instance
+            ChatBedrockConverse: LLM instance
         """
         try:
-            llm = ChatBedrockConverse(
-                model=model_id,
-                provider="anthropic",
-                client=self._shared_bedrock_client,  # Use shared client
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                disable_streaming=disable_streaming
+            llm = _build_bedrock_llm(
+                self._shared_bedrock_client,
+                model_id,
+                temperature,
+                max_tokens,
+                top_p,
+                disable_streaming
             )
             
             self.logger.info(f"Created Bedrock LLM - Model: {model_id}, Temperature: {temperature}, Max Tokens: {max_tokens}, Top P: {top_p}")
@@ -135,7 +236,7 @@ class LLMService:
         max_tokens: int = 25000,
         top_p: float = 0.9,
         stop_sequences: Optional[List[str]] = None
-    ) -> ChatAnthropicBedrock:
+    ) -> "ChatAnthropicBedrock":
         """
         Create a fresh browser-use compatible ChatAnthropicBedrock instance.
         
@@ -152,6 +253,8 @@ class LLMService:
         Returns:
             ChatAnthropicBedrock: Fresh browser-use compatible LLM instance
         """
+        from browser_use.llm import ChatAnthropicBedrock
+        
         try:
             browser_llm = ChatAnthropicBedrock(
                 model=model_id,
@@ -170,10 +273,40 @@ class LLMService:
             self.logger.error(f"Failed to create browser-use LLM: {str(e)}")
             raise
     
+    def stream_response_iter(
+        self,
+        llm: "ChatBedrockConverse",
+        messages: List["BaseMessage"]
+    ) -> Iterator[str]:
+        """
+        Stream response from a given LLM instance, yielding the text of each chunk
+        as it arrives so callers can process it without holding the full response.
+        
+        Args:
+            llm: The LLM instance to use for streaming
+            messages: List of messages (SystemMessage, HumanMessage, etc.)
+            
+        Yields:
+            str: Text of each streamed chunk (empty for chunks without text)
+        """
+        # Bedrock's response format is stable per stream, so pick the extractor
+        # from the first non-empty chunk and reuse it for the rest of the stream
+        extractor = None
+        
+        for chunk in llm.stream(messages):
+            content = chunk.content
+            if extractor is None:
+                if not content:
+                    yield ""
+                    continue
+                extractor = _extract_list_content if isinstance(content, list) else _extract_str_content
+            
+            yield extractor(content)
+    
     def stream_response(
         self,
-        llm: ChatBedrockConverse,
-        messages: List[BaseMessage],
+        llm: "ChatBedrockConverse",
+        messages: List["BaseMessage"],
         print_response: bool = True
     ) -> str:
         """
@@ -190,30 +323,83 @@ class LLMService:
         try:
             self.logger.info(f"Streaming LLM response with {len(messages)} messages")
             
-            # Stream response and collect chunks
-            total_content = ""
+            # Stream response and collect chunks (joined once at the end)
+            parts: list[str] = []
+            
+            # Pending printed output, flushed by size or time
+            output = _OutputBuffer()
+            
+            try:
+                for chunk_content in self.stream_response_iter(llm, messages):
+                    parts.append(chunk_content)
+                    
+                    # Print chunk if there's actual content and printing is enabled
+                    if chunk_content and print_response and output.add(chunk_content):
+                        _write_stdout(output.drain())
+            finally:
+                # Always show whatever was streamed, even if the stream failed
+                if output.parts:
+                    _write_stdout(output.drain())
+            
+            total_content = ''.join(parts)
+            
+            if print_response and total_content:
+                print()  # New line after streaming
+            
+            self.logger.info(f"Completed streaming response with {len(total_content)} characters in {len(parts)} chunks")
+            return total_content
+            
+        except Exception as e:
+            self.logger.error(f"Failed to stream LLM response: {str(e)}")
+            raise
+    
+    async def astream_response(
+        self,
+        llm: "ChatBedrockConverse",
+        messages: List["BaseMessage"],
+        print_response: bool = True
+    ) -> str:
+        """
+        Async variant of stream_response using the LLM's native async streaming,
+        so the event loop stays free for other jobs while tokens arrive.
+        
+        Args:
+            llm: The LLM instance to use for streaming
+            messages: List of messages (SystemMessage, HumanMessage, etc.)
+            print_response: Whether to print response chunks as they stream
+            
+        Returns:
+            str: Complete generated response
+        """
+        try:
+            self.logger.info(f"Streaming LLM response (async) with {len(messages)} messages")
+            
+            parts: list[str] = []
             chunk_count = 0
+            extractor = None
+            output = _OutputBuffer()
             
-            for chunk in llm.stream(messages):
-                # Handle Bedrock's different response formats
-                if isinstance(chunk.content, list):
-                    # Extract text from list format (Bedrock Claude format)
-                    chunk_content = ""
-                    for content_item in chunk.content:
-                        if isinstance(content_item, dict) and content_item.get('type') == 'text':
-                            chunk_content += content_item.get('text', '')
-                        elif isinstance(content_item, str):
-                            chunk_content += content_item
-                else:
-                    # Handle string format (other providers)
-                    chunk_content = chunk.content if chunk.content else ""
-
-                total_content += chunk_content
-                chunk_count += 1
-
-                # Print chunk if there's actual content and printing is enabled
-                if chunk_content and print_response:
-                    print(chunk_content, end='', flush=True)
+            try:
+                async for chunk in llm.astream(messages):
+                    content = chunk.content
+                    if extractor is None:
+                        if not content:
+                            chunk_count += 1
+                            continue
+                        extractor = _extract_list_content if isinstance(content, list) else _extract_str_content
+                    
+                    chunk_content = extractor(content)
+                    parts.append(chunk_content)
+                    chunk_count += 1
+                    
+                    # Terminal writes can block, so they are done off the event loop
+                    if chunk_content and print_response and output.add(chunk_content):
+                        await asyncio.to_thread(_write_stdout, output.drain())
+            finally:
+                if output.parts:
+                    _write_stdout(output.drain())
+            
+            total_content = ''.join(parts)
             
             if print_response and total_content:
                 print()  # New line after streaming
@@ -238,12 +424,36 @@ class LLMService:
         return cls._aws_profile, cls._aws_region
     
     @classmethod
-    def reset_global_resources(cls):
+    def reset_global_resources(cls, reload_config: bool = False):
         """
         Reset global resources. Useful for testing or configuration changes.
+        
+        Args:
+            reload_config: Also drop the cached environment config so it is
+                reloaded on the next initialization
+        """
+        with cls._init_lock:
+            cls._shared_boto3_session = None
+            cls._shared_bedrock_client = None
+            cls._aws_profile = None
+            cls._aws_region = None
+            cls._initialized = False
+            if reload_config:
+                cls._env_config = None
+        
+        # Cached LLM instances are bound to the old client/session
+        cls.clear_llm_cache()
+    
+    @classmethod
+    def clear_llm_cache(cls):
+        """
+        Drop cached Bedrock LLM instances so the next create_bedrock_llm call builds new ones.
+        """
+        _build_bedrock_llm.cache_clear()
+    
+    @classmethod
+    def reload_config(cls):
+        """
+        Reload the environment configuration and rebuild global resources on next use.
         """
-        cls._shared_boto3_session = None
-        cls._shared_bedrock_client = None
-        cls._aws_profile = None
-        cls._aws_region = None
-        cls._initialized = False
+        cls.reset_global_resources(reload_config=True)
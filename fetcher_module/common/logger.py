@@ -1,11 +1,20 @@
 """Common Structured Logger with Job Context"""
 
+import atexit
 import logging
-import json
+import logging.handlers
 import os
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+import orjson
+
+
+def _dumps_entry(log_entry: Dict[str, Any]) -> str:
+    """Serialize a structured log entry to a JSON string"""
+    return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode()
+
 
 class StructuredLogger:
     """Enhanced structured logger with job context for all modules"""
@@ -16,28 +25,46 @@ class StructuredLogger:
         self.module_name = module_name
         self.log_dir = log_dir
         self.logger = None
+        # Static job context shared by every log entry
+        self._context = {
+            "job_id": job_id,
+            "service_id": service_id,
+            "module_name": module_name,
+        }
+        self._thread_id = os.getpid()  # Process ID for now, can be enhanced with actual thread ID
         self._setup_logger()
     
     def _setup_logger(self):
         """Setup structured logger with file and console handlers"""
-        # Create log directory if it doesn't exist
-        os.makedirs(self.log_dir, exist_ok=True)
-        
         # Create logger
         logger_name = f"{self.job_id}_{self.service_id}_{self.module_name}"
         self.logger = logging.getLogger(logger_name)
         self.logger.setLevel(logging.DEBUG)
+        # Records are fully handled here; don't also send them through the root logger
+        self.logger.propagate = False
         
-        # Prevent duplicate handlers
+        # Prevent duplicate handlers (already set up by an earlier instance)
         if self.logger.handlers:
             return
         
+        # Create log directory if it doesn't exist
+        os.makedirs(self.log_dir, exist_ok=True)
+        
         # File handler
         log_filename = f"{self.job_id}_{self.service_id}_{self.module_name}.log"
         log_filepath = os.path.join(self.log_dir, log_filename)
         file_handler = logging.FileHandler(log_filepath)
         file_handler.setLevel(logging.DEBUG)
         
+        # Buffer file writes; flushed when full, on ERROR, on flush() and at exit
+        buffered_file_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler
+        )
+        buffered_file_handler.setLevel(logging.DEBUG)
+        atexit.register(buffered_file_handler.flush)
+        
         # Console handler
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
@@ -49,19 +76,17 @@ class StructuredLogger:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
-        self.logger.addHandler(file_handler)
+        self.logger.addHandler(buffered_file_handler)
         self.logger.addHandler(console_handler)
     
     def _create_log_entry(self, level: str, message: str, extra_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create structured log entry with job context"""
         log_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "job_id": self.job_id,
-            "service_id": self.service_id,
-            "module_name": self.module_name,
+            "timestamp": datetime.utcnow(),
+            **self._context,
             "level": level,
             "message": message,
-            "thread_id": os.getpid(),  # Process ID for now, can be enhanced with actual thread ID
+            "thread_id": self._thread_id,
         }
         
         if extra_data:
@@ -72,22 +97,24 @@ class StructuredLogger:
     def info(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log info level message with structured data"""
         log_entry = self._create_log_entry("INFO", message, extra_data)
-        self.logger.info(json.dumps(log_entry))
+        self.logger.info(_dumps_entry(log_entry))
     
     def error(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log error level message with structured data"""
         log_entry = self._create_log_entry("ERROR", message, extra_data)
-        self.logger.error(json.dumps(log_entry))
+        self.logger.error(_dumps_entry(log_entry))
     
     def debug(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log debug level message with structured data"""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
         log_entry = self._create_log_entry("DEBUG", message, extra_data)
-        self.logger.debug(json.dumps(log_entry))
+        self.logger.debug(_dumps_entry(log_entry))
     
     def warning(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log warning level message with structured data"""
         log_entry = self._create_log_entry("WARNING", message, extra_data)
-        self.logger.warning(json.dumps(log_entry))
+        self.logger.warning(_dumps_entry(log_entry))
     
     def log_execution_start(self, operation: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log start of operation execution"""
@@ -108,7 +135,30 @@ class StructuredLogger:
         else:
             self.error(f"Failed {operation}", data)
     
+    def flush(self):
+        """Write any buffered log records to their destinations"""
+        for handler in self.logger.handlers:
+            handler.flush()
+    
     def get_log_file_path(self) -> str:
-        """Get the path to the log file for this job"""
+        """Get the path to the log file for this job (flushed so it is complete)"""
+        self.flush()
         log_filename = f"{self.job_id}_{self.service_id}_{self.module_name}.log"
         return os.path.join(self.log_dir, log_filename)
+
+
+# Shared StructuredLogger instances keyed by (job_id, service_id, module_name, log_dir)
+_LOGGER_CACHE: Dict[tuple, StructuredLogger] = {}
+_LOGGER_CACHE_LOCK = threading.Lock()
+
+
+def get_logger(job_id: str, service_id: str, module_name: str, log_dir: str = "temp/logs") -> StructuredLogger:
+    """Get a cached StructuredLogger for the given context, creating it on first use"""
+    key = (job_id, service_id, module_name, log_dir)
+    logger = _LOGGER_CACHE.get(key)
+    if logger is None:
+        with _LOGGER_CACHE_LOCK:
+            logger = _LOGGER_CACHE.get(key)
+            if logger is None:
+                logger = _LOGGER_CACHE[key] = StructuredLogger(job_id, service_id, module_name, log_dir)
+    return logger
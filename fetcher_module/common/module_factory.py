@@ -1,40 +1,45 @@
 """Module Factory - Clean Factory Pattern Implementation"""
 
-from typing import Optional
+import importlib
+from functools import lru_cache
+from typing import Optional, Type
 from common.interfaces.base_module import BaseModule
 
 
+# Source type -> (module path, class name); modules are imported lazily on first use
+_MODULE_LOADERS = {
+    "s3": ("modules.s3_module.main", "S3Module"),
+    "ftp": ("modules.ftp_module.main", "FTPModule"),
+    "sftp": ("modules.ftp_module.main", "FTPModule"),
+    "web": ("modules.web_module.main", "WebModule"),
+    "api": ("modules.api_module.main", "APIModule"),
+}
+
+
+@lru_cache(maxsize=None)
+def _resolve_module_class(source_type: str) -> Optional[Type[BaseModule]]:
+    """Import and return the module class for a source type, or None if unknown"""
+    loader = _MODULE_LOADERS.get(source_type)
+    if loader is None:
+        return None
+
+    module_path, class_name = loader
+    return getattr(importlib.import_module(module_path), class_name)
+
+
 class ModuleFactory:
     """Factory for creating module instances based on source type"""
-    
+
     @staticmethod
     def create_module(job_config) -> Optional[BaseModule]:
         """
         Create module instance based on source type
-        
+
         Args:
             job_config: Job configuration object
-            
+
         Returns:
             Module instance or None if unknown source type
         """
-        source_type = job_config.source_type.lower()
-        
-        if source_type == "s3":
-            from modules.s3_module.main import S3Module
-            return S3Module(job_config)
-        
-        elif source_type in ["ftp", "sftp"]:
-            from modules.ftp_module.main import FTPModule
-            return FTPModule(job_config)
-        
-        elif source_type == "web":
-            from modules.web_module.main import WebModule
-            return WebModule(job_config)
-        
-        elif source_type == "api":
-            from modules.api_module.main import APIModule
-            return APIModule(job_config)
-        
-        else:
-            return None
+        module_class = _resolve_module_class(job_config.source_type.lower())
+        return module_class(job_config) if module_class else None
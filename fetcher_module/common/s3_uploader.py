@@ -1,28 +1,39 @@
 """Common S3 Upload Logic with Proper Method Signatures"""
 
 import os
-from typing import Optional, Dict, Any, List
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Iterator
 from datetime import datetime
 
+import orjson
+
 
 class S3Uploader:
     """Common S3 upload functionality for all modules"""
     
-    def __init__(self, job_id: str, channel_id: str, module_name: str, logger=None):
+    def __init__(self, job_id: str, channel_id: str, module_name: str, logger=None, max_workers: int = 16):
         self.job_id = job_id
         self.channel_id = channel_id
         self.module_name = module_name
         self.logger = logger
-        self.bucket_name = self._get_bucket_name()  # TODO: Get from config
+        self.max_workers = max_workers  # Concurrent uploads in upload_directory
+        self.bucket_name = type(self)._get_bucket_name()  # TODO: Get from config
     
-    def _get_bucket_name(self) -> str:
-        """Get S3 bucket name from configuration"""
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _get_bucket_name(cls) -> str:
+        """Get S3 bucket name from configuration (resolved once, shared by all uploaders)"""
         # TODO: Replace with actual config loading
         return "dummy-module-bucket"
     
-    def _generate_s3_key(self, file_path: str, key_prefix: Optional[str] = None) -> str:
-        """Generate S3 key for file upload"""
-        timestamp = datetime.utcnow().strftime("%Y/%m/%d/%H")
+    def _generate_s3_key(self, file_path: str, key_prefix: Optional[str] = None,
+                         timestamp: Optional[str] = None) -> str:
+        """Generate S3 key for file upload (timestamp may be precomputed by batch callers)"""
+        if timestamp is None:
+            timestamp = datetime.utcnow().strftime("%Y/%m/%d/%H")
         filename = os.path.basename(file_path)
         
         if key_prefix:
@@ -32,8 +43,36 @@ class S3Uploader:
         
         return s3_key
     
+    def _iter_files(self, dir_path: str) -> Iterator[os.DirEntry]:
+        """
+        Yield file entries under a directory, in the same order as os.walk
+        (a directory's files before its subdirectories, symlinked directories not followed)
+        """
+        files = []
+        subdirs = []
+        try:
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if not is_dir:
+                        files.append(entry)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+        except OSError:
+            # Unreadable or non-directory path, skipped like os.walk does
+            return
+        
+        yield from files
+        for subdir in subdirs:
+            yield from self._iter_files(subdir)
+    
     def upload_file(self, local_file_path: str, s3_key: Optional[str] = None, 
-                   metadata: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+                   metadata: Optional[Dict[str, str]] = None,
+                   file_size: Optional[int] = None) -> Dict[str, Any]:
         """
         Upload a single file to S3
         
@@ -41,6 +80,7 @@ class S3Uploader:
             local_file_path: Path to local file to upload
             s3_key: Optional custom S3 key, if not provided will be auto-generated
             metadata: Optional metadata to attach to S3 object
+            file_size: Optional already-known file size, saves a stat when provided
             
         Returns:
             Dict with upload result information
@@ -48,6 +88,12 @@ class S3Uploader:
         if not s3_key:
             s3_key = self._generate_s3_key(local_file_path)
         
+        if file_size is None:
+            try:
+                file_size = os.stat(local_file_path).st_size
+            except OSError:
+                file_size = 0
+        
         # TODO: Replace with actual S3 upload logic
         if self.logger:
             self.logger.info(f"DUMMY: Uploading file to S3", {
@@ -64,7 +110,7 @@ class S3Uploader:
             "s3_key": s3_key,
             "local_file": local_file_path,
             "upload_timestamp": datetime.utcnow().isoformat(),
-            "file_size": os.path.getsize(local_file_path) if os.path.exists(local_file_path) else 0
+            "file_size": file_size
         }
         
         return result
@@ -87,25 +133,43 @@ class S3Uploader:
                 self.logger.error(f"Directory not found: {local_dir_path}")
             return []
         
-        upload_results = []
+        upload_tasks = []
+        
+        # Exclude patterns are substrings of the file name, matched with one compiled regex
+        exclude_re = re.compile('|'.join(map(re.escape, exclude_patterns))) if exclude_patterns else None
+        
+        # One hour-granular timestamp for the whole batch
+        timestamp = datetime.utcnow().strftime("%Y/%m/%d/%H")
         
         # TODO: Replace with actual directory traversal and S3 upload logic
-        for root, dirs, files in os.walk(local_dir_path):
-            for file in files:
-                # Skip excluded patterns
-                if exclude_patterns and any(pattern in file for pattern in exclude_patterns):
-                    continue
-                
-                local_file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(local_file_path, local_dir_path)
-                
-                if s3_key_prefix:
-                    s3_key = f"{s3_key_prefix}/{relative_path}"
-                else:
-                    s3_key = self._generate_s3_key(local_file_path, "directory-upload")
-                
-                result = self.upload_file(local_file_path, s3_key)
-                upload_results.append(result)
+        for entry in self._iter_files(local_dir_path):
+            # Skip excluded patterns
+            if exclude_re and exclude_re.search(entry.name):
+                continue
+            
+            local_file_path = entry.path
+            relative_path = os.path.relpath(local_file_path, local_dir_path)
+            
+            if s3_key_prefix:
+                s3_key = f"{s3_key_prefix}/{relative_path}"
+            else:
+                s3_key = self._generate_s3_key(local_file_path, "directory-upload", timestamp)
+            
+            # Size from the traversal's stat (cached on the DirEntry)
+            try:
+                file_size = entry.stat().st_size
+            except OSError:
+                file_size = 0
+            
+            upload_tasks.append((local_file_path, s3_key, None, file_size))
+        
+        # Uploads are independent and I/O bound, so run them on a thread pool
+        # (results keep the traversal order)
+        if upload_tasks:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(upload_tasks))) as executor:
+                upload_results = list(executor.map(lambda task: self.upload_file(*task), upload_tasks))
+        else:
+            upload_results = []
         
         if self.logger:
             self.logger.info(f"DUMMY: Directory upload completed", {
@@ -148,19 +212,17 @@ class S3Uploader:
         Returns:
             Upload result information
         """
-        import json
-        import tempfile
-        
         # Create temporary file with results
         timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
         temp_filename = f"results_{self.job_id}_{self.channel_id}_{timestamp}.{file_format}"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix=f'.{file_format}', delete=False) as temp_file:
+        with tempfile.NamedTemporaryFile(mode='wb', suffix=f'.{file_format}', delete=False) as temp_file:
             if file_format == "json":
-                json.dump(results_data, temp_file, indent=2)
+                # Compact encoding: results are read by machines, not people
+                temp_file.write(orjson.dumps(results_data, option=orjson.OPT_NON_STR_KEYS))
             else:
                 # TODO: Add support for other formats
-                temp_file.write(str(results_data))
+                temp_file.write(str(results_data).encode('utf-8'))
             
             temp_file_path = temp_file.name
         
@@ -1,5 +1,57 @@
 """File Utility Functions"""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Set
+
+
+# Directory checks run in parallel threads (the syscalls release the GIL) once a
+# batch spans at least this many directories; below that threads cost more than they save
+_PARALLEL_DIRECTORY_THRESHOLD = 8
+_MAX_CHECK_WORKERS = 32
+
+
+def _existing_in_directory(dir_path: str, dir_files: List[str]) -> List[str]:
+    """Return the paths of one parent directory that exist"""
+    # A single path is cheaper to stat than listing its whole directory
+    if len(dir_files) == 1:
+        return dir_files if os.path.exists(dir_files[0]) else []
+    
+    try:
+        with os.scandir(dir_path or ".") as entries:
+            dir_entries = {entry.name: entry for entry in entries}
+    except OSError:
+        return []
+    
+    existing = []
+    for file_path in dir_files:
+        entry = dir_entries.get(os.path.basename(file_path))
+        # Symlinks count only when their target exists, as with os.path.exists
+        if entry is not None and (not entry.is_symlink() or os.path.exists(file_path)):
+            existing.append(file_path)
+    return existing
+
+
+def find_existing_files(file_paths: Iterable[str]) -> Set[str]:
+    """
+    Return the subset of file_paths that exist
+    
+    Paths are grouped by parent directory and each directory is listed once with
+    os.scandir instead of stat-ing every path (downloads usually share a folder).
+    Batches spread over many directories are checked concurrently.
+    """
+    paths_by_dir: Dict[str, List[str]] = {}
+    for file_path in file_paths:
+        paths_by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+    
+    if len(paths_by_dir) < _PARALLEL_DIRECTORY_THRESHOLD:
+        results = [_existing_in_directory(dir_path, dir_files) for dir_path, dir_files in paths_by_dir.items()]
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_CHECK_WORKERS, len(paths_by_dir))) as executor:
+            results = list(executor.map(_existing_in_directory, paths_by_dir.keys(), paths_by_dir.values()))
+    
+    return {file_path for existing in results for file_path in existing}
+
 
 class FileUtils:
     """Common file operations"""
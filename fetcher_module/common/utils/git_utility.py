@@ -3,16 +3,30 @@ Git utility for automated code deployment
 """
 
 import os
-import git
-from typing import List, Optional, Dict, Any
+import asyncio
+import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 
 from ..config_loader.env_selector import EnvironmentSelector
 
+# pygit2 (libgit2) is imported where it is used, so importing GitResult or the
+# helpers doesn't load it; this is for type hints only.
+if TYPE_CHECKING:
+    import pygit2
 
-@dataclass
+# Commit identity used when neither git nor the GIT config provides one
+_DEFAULT_AUTHOR_NAME = "fetcher"
+_DEFAULT_AUTHOR_EMAIL = "fetcher@localhost"
+
+
+@dataclass(frozen=True, slots=True)
 class GitResult:
     """Result of git operations with comprehensive metadata"""
     
@@ -24,10 +38,13 @@ class GitResult:
     error_message: Optional[str] = None
     timestamp: datetime = None
     repo_path: Optional[str] = None
+    # ISO form of timestamp, formatted once since results are immutable
+    _timestamp_iso: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            object.__setattr__(self, "timestamp", datetime.now())
+        object.__setattr__(self, "_timestamp_iso", self.timestamp.isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for serialization"""
@@ -38,7 +55,7 @@ class GitResult:
             "branch": self.branch,
             "files_processed": self.files_processed,
             "error_message": self.error_message,
-            "timestamp": self.timestamp.isoformat() if self.timestamp else None,
+            "timestamp": self._timestamp_iso,
             "repo_path": self.repo_path
         }
     
@@ -47,67 +64,288 @@ class GitResult:
         return f"{status}: {self.operation} - {self.error_message or 'Completed successfully'}"
 
 
+@lru_cache(maxsize=1)
+def _status_flag_groups() -> Tuple[int, int, int]:
+    """
+    Status flags for untracked files and for changes in the working tree and the
+    index (matching GitPython's untracked_files / index.diff(None) / index.diff("HEAD"))
+    """
+    from pygit2.enums import FileStatus
+    
+    untracked = FileStatus.WT_NEW
+    worktree_changed = (FileStatus.WT_MODIFIED | FileStatus.WT_DELETED |
+                        FileStatus.WT_TYPECHANGE | FileStatus.WT_RENAMED)
+    index_changed = (FileStatus.INDEX_NEW | FileStatus.INDEX_MODIFIED | FileStatus.INDEX_DELETED |
+                     FileStatus.INDEX_TYPECHANGE | FileStatus.INDEX_RENAMED)
+    return untracked, worktree_changed, index_changed
+
+
+@lru_cache(maxsize=1)
+def _load_git_config() -> Dict[str, Any]:
+    """Load the GIT section of the environment config once per process"""
+    return EnvironmentSelector().load_config().get("GIT", {})
+
+
+def reload_git_config() -> None:
+    """Drop the cached GIT config so the next GitUtility reloads it"""
+    _load_git_config.cache_clear()
+
+
 class GitUtility:
     """Production-ready git utility for automated deployments"""
     
-    def __init__(self, module_name: str, branch: Optional[str] = None):
+    def __init__(self, module_name: str, branch: Optional[str] = None, bare: Optional[bool] = None):
         """
         Initialize git utility for specific module
         
         Args:
             module_name: Module name (web, api, s3, ftp)
             branch: Target branch (defaults to config default)
+            bare: Use the repository without a working tree (read-only status and
+                fetch; defaults to the "bare" config value)
         """
         self.module_name = module_name
         
-        # Load configuration
-        env_selector = EnvironmentSelector()
-        config_dict = env_selector.load_config()
-        self.git_config = config_dict.get("GIT", {})
+        # Load configuration (cached across instances)
+        self.git_config = _load_git_config()
         
-        # Set branch
+        # Set branch and repository mode
         self.branch = branch or self.git_config.get("default_branch", "main")
+        self.bare = self.git_config.get("bare", False) if bare is None else bare
         
         # Get repository and module paths
         self.repo_path = self._get_module_repo_path()
         self.module_path = self._get_module_folder_path()
         self.repo = None
         
+        # HEAD-derived status fields, keyed by (HEAD ref name, HEAD target)
+        self._head_info_cache: Optional[Tuple[Tuple[str, str], Dict[str, Any]]] = None
+        
         # Initialize repository connection
         self._connect_to_repo()
+        if self.bare:
+            self._check_module_tree()
+        
+        # Environment for git CLI network operations
+        self._git_env = self._build_git_env()
     
     def _get_module_repo_path(self) -> Path:
-        """Get repository path (base repo, not module subfolder)"""
-        base_path = Path(self.git_config.get("base_repo_path", ""))
+        """Get repository path (base repo, not module subfolder), cloning it if configured"""
+        base_path = Path(self.git_config.get("base_repo_path", "")).resolve()
+        
+        # Modules share the base repo and are set up in parallel, so only one may clone it
+        with _repo_lock(base_path):
+            if not base_path.exists():
+                remote_url = self.git_config.get("remote_url")
+                if not remote_url:
+                    raise ValueError(f"Base repository path does not exist: {base_path}")
+                
+                clone_result = clone_repository(
+                    remote_url,
+                    str(base_path),
+                    branch=self.branch,
+                    bare=self.bare,
+                    partial_clone_filter=self.git_config.get("partial_clone_filter")
+                )
+                if not clone_result.success:
+                    raise ValueError(f"Failed to clone repository: {clone_result.error_message}")
+        
+        ram_disk_path = self.git_config.get("ram_disk_path")
+        if ram_disk_path:
+            return self._get_ram_disk_repo_path(base_path, Path(ram_disk_path).resolve())
         
-        if not base_path.exists():
-            raise ValueError(f"Base repository path does not exist: {base_path}")
+        return base_path
+    
+    def _get_ram_disk_repo_path(self, base_path: Path, ram_disk_path: Path) -> Path:
+        """
+        Get the scratch clone on a RAM disk (e.g. /dev/shm), creating it on first use
+        
+        The clone borrows objects from the base repository and then dissociates, so it
+        is self-contained; it is bounded by the tmpfs size and lost on reboot, after
+        which it is simply recreated. Origin stays the real remote so pushes go upstream.
+        """
+        with _repo_lock(ram_disk_path):
+            if not ram_disk_path.exists():
+                import pygit2
+                
+                remote_url = self.git_config.get("remote_url")
+                if not remote_url:
+                    base_repo = pygit2.Repository(str(base_path))
+                    remote_url = base_repo.remotes["origin"].url if "origin" in base_repo.remotes.names() else str(base_path)
+                
+                clone_result = clone_repository(
+                    remote_url,
+                    str(ram_disk_path),
+                    branch=self.branch,
+                    bare=self.bare,
+                    partial_clone_filter=self.git_config.get("partial_clone_filter"),
+                    reference=str(base_path)
+                )
+                if not clone_result.success:
+                    raise ValueError(f"Failed to clone repository to RAM disk: {clone_result.error_message}")
         
-        return base_path.resolve()
+        return ram_disk_path
     
     def _get_module_folder_path(self) -> Path:
         """Get module folder path within the repository"""
         module_folder = self.git_config.get("modules", {}).get(self.module_name, self.module_name)
         module_path = self.repo_path / module_folder
         
+        # No working tree when bare; the folder is checked in HEAD's tree instead
+        if self.bare:
+            return module_path
+        
         if not module_path.exists():
             raise ValueError(f"Module folder does not exist: {module_path}")
         
         return module_path.resolve()
     
+    def _check_module_tree(self) -> None:
+        """Validate the module folder exists in HEAD's tree (bare repositories)"""
+        if self.repo.head_is_unborn:
+            return
+        
+        module_folder = self.module_path.relative_to(self.repo_path).as_posix()
+        try:
+            self._head_commit().tree[module_folder]
+        except KeyError:
+            raise ValueError(f"Module folder does not exist: {module_folder}")
+    
     def _connect_to_repo(self) -> None:
         """Connect to git repository and validate"""
+        import pygit2
+        from pygit2.enums import RepositoryOpenFlag
+        
         try:
-            self.repo = git.Repo(self.repo_path)
+            self.repo = pygit2.Repository(str(self.repo_path), RepositoryOpenFlag.NO_SEARCH)
             
-            if self.repo.bare:
+            if self.repo.is_bare and not self.bare:
                 raise ValueError(f"Repository is bare: {self.repo_path}")
                 
-        except git.InvalidGitRepositoryError:
+        except pygit2.GitError:
             raise ValueError(f"Not a valid git repository: {self.repo_path}")
         except Exception as e:
             raise ValueError(f"Failed to connect to repository: {e}")
     
+    def _build_git_env(self) -> Optional[Dict[str, str]]:
+        """
+        Environment for git CLI calls. When "ssh_control_persist" is set (seconds,
+        off by default), consecutive pull/push calls over SSH share one multiplexed
+        connection (ControlMaster) instead of a new handshake per call.
+        Returns None (inherit the environment) when disabled or when the user
+        already configures the SSH command.
+        """
+        control_persist = self.git_config.get("ssh_control_persist")
+        if not control_persist:
+            return None
+        
+        if "GIT_SSH_COMMAND" in os.environ or "GIT_SSH" in os.environ or "core.sshCommand" in self.repo.config:
+            return None
+        
+        control_path = os.path.join(tempfile.gettempdir(), "git-ssh-%C")
+        env = dict(os.environ)
+        env["GIT_SSH_COMMAND"] = (
+            f"ssh -o ControlMaster=auto -o ControlPersist={control_persist} -o ControlPath={control_path}"
+        )
+        return env
+    
+    def _run_git(self, *args: str) -> subprocess.CompletedProcess:
+        """
+        Run a git CLI command in the repository.
+        
+        Only used for network operations (pull/push), so the user's credential
+        helpers and SSH configuration apply exactly as with plain git.
+        """
+        if self._git_env is None:
+            return subprocess.run(
+                ["git", *args],
+                cwd=str(self.repo_path),
+                capture_output=True,
+                text=True
+            )
+        
+        # A persisted SSH master inherits stderr and outlives git; capturing it
+        # through a pipe would block until the master exits, so use a file
+        with tempfile.TemporaryFile(mode="w+") as stderr_file:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=str(self.repo_path),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                env=self._git_env
+            )
+            stderr_file.seek(0)
+            result.stderr = stderr_file.read()
+        return result
+    
+    def _current_branch(self) -> str:
+        """Name of the checked out branch"""
+        return self.repo.head.shorthand
+    
+    def _checkout_branch(self, branch_name: str) -> None:
+        """Check out a local branch, creating it from origin if it only exists there"""
+        import pygit2
+        
+        branch = self.repo.branches.local.get(branch_name)
+        
+        if branch is None:
+            # Branch might not exist locally, create it tracking origin
+            remote_branch = self.repo.branches.remote.get(f"origin/{branch_name}")
+            if remote_branch is None:
+                raise ValueError(f"Branch not found locally or on origin: {branch_name}")
+            
+            branch = self.repo.branches.local.create(branch_name, remote_branch.peel(pygit2.Commit))
+            branch.upstream = remote_branch
+        
+        self.repo.checkout(branch)
+    
+    def _commit_signature(self) -> "pygit2.Signature":
+        """
+        Identity for commits: the repository's user.name/user.email, falling back to
+        GIT "author_name"/"author_email" or a default when git has none configured
+        """
+        import pygit2
+        
+        try:
+            return self.repo.default_signature
+        except (KeyError, pygit2.GitError):
+            return pygit2.Signature(
+                self.git_config.get("author_name") or _DEFAULT_AUTHOR_NAME,
+                self.git_config.get("author_email") or _DEFAULT_AUTHOR_EMAIL
+            )
+    
+    def _head_commit(self) -> "pygit2.Commit":
+        """Commit currently pointed to by HEAD"""
+        import pygit2
+        
+        return self.repo.head.peel(pygit2.Commit)
+    
+    def _head_info(self) -> Dict[str, Any]:
+        """
+        Branch and last-commit fields for status, recomputed only when HEAD moves
+        (checkout, commit, pull) rather than on every status call
+        """
+        import pygit2
+        
+        head = self.repo.head
+        cache_key = (head.name, str(head.target))
+        if self._head_info_cache is not None and self._head_info_cache[0] == cache_key:
+            return self._head_info_cache[1]
+        
+        head_commit = head.peel(pygit2.Commit)
+        commit_tz = timezone(timedelta(minutes=head_commit.commit_time_offset))
+        head_info = {
+            "current_branch": head.shorthand,
+            "last_commit_hash": str(head_commit.id)[:8],
+            "last_commit_full_hash": str(head_commit.id),
+            "last_commit_message": head_commit.message.strip(),
+            "last_commit_author": head_commit.author.name,
+            "last_commit_date": datetime.fromtimestamp(head_commit.commit_time, commit_tz).isoformat(),
+        }
+        self._head_info_cache = (cache_key, head_info)
+        return head_info
+    
     def sync_latest(self) -> GitResult:
         """
         Sync latest changes from remote repository
@@ -116,23 +354,34 @@ class GitUtility:
             GitResult with operation details
         """
         try:
+            if self.bare:
+                # No working tree: fast-forward the local branch from origin
+                fetch = self._run_git("fetch", "origin", f"{self.branch}:{self.branch}")
+                if fetch.returncode != 0:
+                    raise RuntimeError(f"git fetch failed: {fetch.stderr.strip()}")
+                
+                return GitResult(
+                    success=True,
+                    operation="sync",
+                    branch=self.branch,
+                    commit_hash=str(self.repo.branches.local[self.branch].target)[:8],
+                    repo_path=str(self.repo_path)
+                )
+            
             # Ensure we're on the correct branch
-            if self.repo.active_branch.name != self.branch:
-                try:
-                    self.repo.git.checkout(self.branch)
-                except git.GitCommandError:
-                    # Branch might not exist locally, create it
-                    self.repo.git.checkout('-b', self.branch, f'origin/{self.branch}')
+            if self._current_branch() != self.branch:
+                self._checkout_branch(self.branch)
             
             # Pull latest changes
-            origin = self.repo.remotes.origin
-            origin.pull(self.branch)
+            pull = self._run_git("pull", "origin", self.branch)
+            if pull.returncode != 0:
+                raise RuntimeError(f"git pull failed: {pull.stderr.strip()}")
             
             return GitResult(
                 success=True,
                 operation="sync",
                 branch=self.branch,
-                commit_hash=str(self.repo.head.commit.hexsha[:8]),
+                commit_hash=str(self._head_commit().id)[:8],
                 repo_path=str(self.repo_path)
             )
             
@@ -156,9 +405,20 @@ class GitUtility:
         Returns:
             GitResult with comprehensive metadata
         """
+        if self.bare:
+            return GitResult(
+                success=False,
+                operation="push_files",
+                branch=self.branch,
+                files_processed=file_paths,
+                error_message="Pushing files requires a working tree; repository is opened bare",
+                repo_path=str(self.repo_path)
+            )
+        
         try:
-            # Step 1: Sync repository if auto_sync is enabled
-            if self.git_config.get("auto_sync", True):
+            # Step 1: Sync repository if auto_sync is enabled (this also checks out the branch)
+            synced = self.git_config.get("auto_sync", True)
+            if synced:
                 sync_result = self.sync_latest()
                 if not sync_result.success:
                     return GitResult(
@@ -170,59 +430,74 @@ class GitUtility:
                         repo_path=str(self.repo_path)
                     )
             
-            # Step 2: Validate and convert file paths
+            # Step 2: Validate and convert file paths in one pass, reporting every bad path
+            repo_root = str(self.repo_path)
             relative_files = []
+            missing_files = []
+            outside_files = []
             for file_path in file_paths:
-                abs_path = Path(file_path).resolve()
+                abs_path = os.path.abspath(file_path)
                 
                 # Validate file exists
-                if not abs_path.exists():
-                    return GitResult(
-                        success=False,
-                        operation="push_files",
-                        branch=self.branch,
-                        files_processed=file_paths,
-                        error_message=f"File not found: {abs_path}",
-                        repo_path=str(self.repo_path)
-                    )
+                if not os.path.exists(abs_path):
+                    missing_files.append(abs_path)
+                    continue
+                
+                # Lexical containment check first; only resolve symlinks when that fails
+                if os.path.commonpath([repo_root, abs_path]) != repo_root:
+                    abs_path = os.path.realpath(abs_path)
+                    if os.path.commonpath([repo_root, abs_path]) != repo_root:
+                        outside_files.append(abs_path)
+                        continue
                 
                 # Convert to relative path from repo root
-                try:
-                    relative_path = abs_path.relative_to(self.repo_path)
-                    relative_files.append(str(relative_path))
-                except ValueError:
-                    return GitResult(
-                        success=False,
-                        operation="push_files",
-                        branch=self.branch,
-                        files_processed=file_paths,
-                        error_message=f"File is outside repository: {abs_path}",
-                        repo_path=str(self.repo_path)
-                    )
+                relative_files.append(os.path.relpath(abs_path, repo_root).replace(os.sep, "/"))
             
-            # Step 3: Ensure we're on correct branch
-            if self.repo.active_branch.name != self.branch:
-                self.repo.git.checkout(self.branch)
+            if missing_files or outside_files:
+                errors = []
+                if missing_files:
+                    errors.append(f"File not found: {', '.join(missing_files)}")
+                if outside_files:
+                    errors.append(f"File is outside repository: {', '.join(outside_files)}")
+                return GitResult(
+                    success=False,
+                    operation="push_files",
+                    branch=self.branch,
+                    files_processed=file_paths,
+                    error_message="; ".join(errors),
+                    repo_path=str(self.repo_path)
+                )
             
-            # Step 4: Add files to staging
-            self.repo.index.add(relative_files)
+            # Step 3: Ensure we're on correct branch; a successful sync already did this
+            if not synced and self._current_branch() != self.branch:
+                self._checkout_branch(self.branch)
+            
+            # Step 4: Add files to staging (re-read first, the pull may have updated it)
+            index = self.repo.index
+            index.read()
+            for relative_file in relative_files:
+                index.add(relative_file)
+            index.write()
             
             # Step 5: Commit changes
-            commit = self.repo.index.commit(commit_message)
+            tree = index.write_tree()
+            signature = self._commit_signature()
+            parents = [] if self.repo.head_is_unborn else [self.repo.head.target]
+            commit_id = self.repo.create_commit("HEAD", signature, signature, commit_message, tree, parents)
+            commit_hash = str(commit_id)[:8]
             
             # Step 6: Push to remote
-            origin = self.repo.remotes.origin
-            push_info = origin.push(self.branch)
+            push = self._run_git("push", "origin", self.branch)
             
             # Check if push was successful
-            if push_info and push_info[0].flags & push_info[0].ERROR:
+            if push.returncode != 0:
                 return GitResult(
                     success=False,
                     operation="push_files",
                     branch=self.branch,
                     files_processed=relative_files,
-                    commit_hash=str(commit.hexsha[:8]),
-                    error_message=f"Push failed: {push_info[0].summary}",
+                    commit_hash=commit_hash,
+                    error_message=f"Push failed: {push.stderr.strip()}",
                     repo_path=str(self.repo_path)
                 )
             
@@ -230,7 +505,7 @@ class GitUtility:
             return GitResult(
                 success=True,
                 operation="push_files",
-                commit_hash=str(commit.hexsha[:8]),
+                commit_hash=commit_hash,
                 branch=self.branch,
                 files_processed=relative_files,
                 repo_path=str(self.repo_path)
@@ -246,6 +521,30 @@ class GitUtility:
                 repo_path=str(self.repo_path)
             )
     
+    async def sync_latest_async(self) -> GitResult:
+        """
+        Async variant of sync_latest, run in a worker thread so the event loop
+        stays free while git talks to the remote
+        
+        Returns:
+            GitResult with operation details
+        """
+        return await asyncio.to_thread(self.sync_latest)
+    
+    async def push_files_async(self, file_paths: List[str], commit_message: str) -> GitResult:
+        """
+        Async variant of push_files, run in a worker thread so the event loop
+        stays free while git syncs, commits and pushes
+        
+        Args:
+            file_paths: List of absolute file paths to push
+            commit_message: Commit message
+            
+        Returns:
+            GitResult with comprehensive metadata
+        """
+        return await asyncio.to_thread(self.push_files, file_paths, commit_message)
+    
     def get_repo_status(self) -> Dict[str, Any]:
         """
         Get current repository status and metadata
@@ -254,21 +553,33 @@ class GitUtility:
             Dictionary with comprehensive repository information
         """
         try:
+            head_info = self._head_info()
+            
+            # Working tree state is always read fresh; one status pass gives untracked, modified (worktree) and staged (index) files
+            # (bare repositories have no working tree or index to compare)
+            status = {} if self.bare else self.repo.status(untracked_files="all")
+            untracked, worktree_changed, index_changed = _status_flag_groups()
+            untracked_files = [path for path, flags in status.items() if flags & untracked]
+            modified_files = [path for path, flags in status.items() if flags & worktree_changed]
+            staged_files = [path for path, flags in status.items() if flags & index_changed]
+            
+            origin = self.repo.remotes["origin"] if "origin" in self.repo.remotes.names() else None
+            
             return {
                 "repo_path": str(self.repo_path),
                 "module_name": self.module_name,
-                "current_branch": self.repo.active_branch.name,
+                "current_branch": head_info["current_branch"],
                 "target_branch": self.branch,
-                "last_commit_hash": str(self.repo.head.commit.hexsha[:8]),
-                "last_commit_full_hash": str(self.repo.head.commit.hexsha),
-                "last_commit_message": self.repo.head.commit.message.strip(),
-                "last_commit_author": str(self.repo.head.commit.author),
-                "last_commit_date": self.repo.head.commit.committed_datetime.isoformat(),
-                "is_dirty": self.repo.is_dirty(),
-                "untracked_files": self.repo.untracked_files,
-                "modified_files": [item.a_path for item in self.repo.index.diff(None)],
-                "staged_files": [item.a_path for item in self.repo.index.diff("HEAD")],
-                "remote_url": str(self.repo.remotes.origin.url) if self.repo.remotes.origin else None
+                "last_commit_hash": head_info["last_commit_hash"],
+                "last_commit_full_hash": head_info["last_commit_full_hash"],
+                "last_commit_message": head_info["last_commit_message"],
+                "last_commit_author": head_info["last_commit_author"],
+                "last_commit_date": head_info["last_commit_date"],
+                "is_dirty": bool(modified_files or staged_files),
+                "untracked_files": untracked_files,
+                "modified_files": modified_files,
+                "staged_files": staged_files,
+                "remote_url": origin.url if origin else None
             }
         except Exception as e:
             return {
@@ -278,13 +589,27 @@ class GitUtility:
             }
 
 
-def create_git_utility(module_name: str, branch: Optional[str] = None) -> GitUtility:
+# Modules usually share one base repository (and its index/HEAD), so writes to the
+# same repository are serialized while different repositories run in parallel
+_REPO_LOCKS: Dict[str, threading.Lock] = {}
+_REPO_LOCKS_GUARD = threading.Lock()
+
+
+def _repo_lock(repo_path: Path) -> threading.Lock:
+    """Get the lock serializing write operations on a repository"""
+    with _REPO_LOCKS_GUARD:
+        return _REPO_LOCKS.setdefault(str(repo_path), threading.Lock())
+
+
+def create_git_utility(module_name: str, branch: Optional[str] = None,
+                       bare: Optional[bool] = None) -> GitUtility:
     """
     Factory function to create GitUtility instance
     
     Args:
         module_name: Module name (web, api, s3, ftp)
         branch: Target branch (optional)
+        bare: Open the repository without a working tree (optional, config default)
         
     Returns:
         GitUtility instance
@@ -292,7 +617,46 @@ def create_git_utility(module_name: str, branch: Optional[str] = None) -> GitUti
     Raises:
         ValueError: If module or repository is invalid
     """
-    return GitUtility(module_name, branch)
+    return GitUtility(module_name, branch, bare)
+
+
+def clone_repository(remote_url: str, repo_path: str, branch: Optional[str] = None,
+                     bare: bool = False, partial_clone_filter: Optional[str] = None,
+                     reference: Optional[str] = None) -> GitResult:
+    """
+    Clone a repository, optionally bare and/or as a partial clone
+    
+    Args:
+        remote_url: URL of the repository to clone
+        repo_path: Local destination path
+        branch: Branch to check out (optional)
+        bare: Clone without a working tree
+        partial_clone_filter: Object filter such as "blob:none" to fetch blobs on demand
+        reference: Local repository to copy existing objects from instead of fetching them
+        
+    Returns:
+        GitResult with operation details
+    """
+    command = ["git", "clone"]
+    if bare:
+        command.append("--bare")
+    if partial_clone_filter:
+        command.append(f"--filter={partial_clone_filter}")
+    if branch:
+        command.extend(["--branch", branch])
+    if reference:
+        command.extend(["--reference", reference, "--dissociate"])
+    command.extend([remote_url, repo_path])
+    
+    clone = subprocess.run(command, capture_output=True, text=True)
+    
+    return GitResult(
+        success=clone.returncode == 0,
+        operation="clone",
+        branch=branch,
+        error_message=clone.stderr.strip() if clone.returncode != 0 else None,
+        repo_path=repo_path
+    )
 
 
 # Convenience functions for common operations
@@ -311,7 +675,8 @@ def push_to_module(module_name: str, file_paths: List[str], commit_message: str,
         GitResult with operation details
     """
     git_util = create_git_utility(module_name, branch)
-    return git_util.push_files(file_paths, commit_message)
+    with _repo_lock(git_util.repo_path):
+        return git_util.push_files(file_paths, commit_message)
 
 
 def sync_module(module_name: str, branch: Optional[str] = None) -> GitResult:
@@ -326,7 +691,8 @@ def sync_module(module_name: str, branch: Optional[str] = None) -> GitResult:
         GitResult with operation details
     """
     git_util = create_git_utility(module_name, branch)
-    return git_util.sync_latest()
+    with _repo_lock(git_util.repo_path):
+        return git_util.sync_latest()
 
 
 def get_module_status(module_name: str, branch: Optional[str] = None) -> Dict[str, Any]:
@@ -342,3 +708,88 @@ def get_module_status(module_name: str, branch: Optional[str] = None) -> Dict[st
     """
     git_util = create_git_utility(module_name, branch)
     return git_util.get_repo_status()
+
+
+def push_to_modules(module_files: Dict[str, Tuple[List[str], str]],
+                    branch: Optional[str] = None) -> Dict[str, GitResult]:
+    """
+    Push files to several module repositories concurrently
+    
+    Args:
+        module_files: Mapping of module name to (file paths, commit message)
+        branch: Target branch (optional)
+        
+    Returns:
+        Dictionary of module name to GitResult
+    """
+    def push(module_name: str) -> GitResult:
+        file_paths, commit_message = module_files[module_name]
+        try:
+            return push_to_module(module_name, file_paths, commit_message, branch)
+        except Exception as e:
+            return GitResult(
+                success=False,
+                operation="push_files",
+                branch=branch,
+                files_processed=file_paths,
+                error_message=str(e)
+            )
+    
+    return _run_for_modules(list(module_files), push)
+
+
+def sync_modules(module_names: List[str], branch: Optional[str] = None) -> Dict[str, GitResult]:
+    """
+    Sync latest changes for several modules concurrently
+    
+    Args:
+        module_names: Module names (web, api, s3, ftp)
+        branch: Target branch (optional)
+        
+    Returns:
+        Dictionary of module name to GitResult
+    """
+    def sync(module_name: str) -> GitResult:
+        try:
+            return sync_module(module_name, branch)
+        except Exception as e:
+            return GitResult(
+                success=False,
+                operation="sync",
+                branch=branch,
+                error_message=str(e)
+            )
+    
+    return _run_for_modules(module_names, sync)
+
+
+def get_modules_status(module_names: List[str], branch: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get repository status for several modules concurrently
+    
+    Args:
+        module_names: Module names (web, api, s3, ftp)
+        branch: Target branch (optional)
+        
+    Returns:
+        Dictionary of module name to repository status
+    """
+    def status(module_name: str) -> Dict[str, Any]:
+        try:
+            return get_module_status(module_name, branch)
+        except Exception as e:
+            return {
+                "error": str(e),
+                "module_name": module_name
+            }
+    
+    return _run_for_modules(module_names, status)
+
+
+def _run_for_modules(module_names: List[str], operation) -> Dict[str, Any]:
+    """Run a per-module operation on a thread pool, keyed by module name"""
+    if not module_names:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=len(module_names)) as executor:
+        return dict(zip(module_names, executor.map(operation, module_names)))
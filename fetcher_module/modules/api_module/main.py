@@ -3,7 +3,11 @@
 import os
 import json
 import asyncio
+from functools import cached_property
 from typing import Dict, Any, List
+
+import orjson
+
 from common.interfaces.base_module import BaseModule
 
 
@@ -23,7 +27,6 @@ class APIModule(BaseModule):
             # TODO: Initialize API client
             # self.session = aiohttp.ClientSession()
             # self.session.headers.update({'Authorization': f'Bearer {token}'})
-            await asyncio.sleep(0.1)  # Simulate async initialization
             self.logger.info("API module initialized")
             return True
         except Exception as e:
@@ -42,9 +45,9 @@ class APIModule(BaseModule):
             # 3. Save responses to self.temp_dir
             # 4. Return actual file paths
             
-            # Dummy implementation with async simulation
-            downloaded_files = []
-            for i in range(2):
+            # Dummy implementation with async simulation; requests are independent,
+            # so they run concurrently
+            async def fetch_one(i: int) -> str:
                 # Simulate async API call
                 await asyncio.sleep(0.4)
                 
@@ -56,9 +59,11 @@ class APIModule(BaseModule):
                     "status": "success"
                 }
                 
-                with open(file_path, 'w') as f:
-                    json.dump(response_data, f, indent=2)
-                downloaded_files.append(file_path)
+                # Write off the event loop so other requests keep progressing
+                await asyncio.to_thread(self._write_json, file_path, response_data)
+                return file_path
+            
+            downloaded_files = list(await asyncio.gather(*(fetch_one(i) for i in range(2))))
             
             return {
                 "success": True,
@@ -68,6 +73,32 @@ class APIModule(BaseModule):
         except Exception as e:
             return {"success": False, "error": str(e), "files_downloaded": []}
     
+    @staticmethod
+    def _write_json(file_path: str, data: Dict[str, Any]) -> None:
+        """Write a JSON response file"""
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+    
+    @staticmethod
+    def _is_valid_json_file(file_path: str) -> bool:
+        """Check that a response file exists and parses as JSON"""
+        if not (os.path.exists(file_path) and file_path.endswith('.json')):
+            return False
+        
+        with open(file_path, 'rb') as f:
+            content = f.read()
+        
+        try:
+            orjson.loads(content)
+            return True
+        except (orjson.JSONDecodeError, UnicodeDecodeError):
+            return False
+    
+    @cached_property
+    def upload_folder(self) -> str:
+        """S3 folder validated files are uploaded to; fixed for the module's channel"""
+        return f"data/api/ch_{self.channel_number}/responses"
+    
     async def validate_data(self, fetch_result: Dict[str, Any]) -> Dict[str, Any]:
         """Validate API response files (async)"""
         try:
@@ -85,25 +116,22 @@ class APIModule(BaseModule):
             valid_files = []
             invalid_files = []
             
-            for file_path in files:
-                try:
-                    if os.path.exists(file_path) and file_path.endswith('.json'):
-                        with open(file_path, 'r') as f:
-                            json.load(f)  # Try to parse JSON
-                        valid_files.append(file_path)
-                    else:
-                        invalid_files.append(file_path)
-                except json.JSONDecodeError:
+            # Files are checked concurrently in worker threads
+            checks = await asyncio.gather(
+                *(asyncio.to_thread(self._is_valid_json_file, file_path) for file_path in files)
+            )
+            for file_path, is_valid in zip(files, checks):
+                if is_valid:
+                    valid_files.append(file_path)
+                else:
                     invalid_files.append(file_path)
             
-            upload_folder = f"data/api/ch_{self.channel_number}/responses"
-            
             return {
                 "success": len(valid_files) > 0,
                 "valid_files": valid_files,
                 "invalid_files": invalid_files,
                 "validation_errors": [],
-                "upload_folder": upload_folder
+                "upload_folder": self.upload_folder
             }
         except Exception as e:
             return {
@@ -3,6 +3,62 @@
 from typing import Dict, Any, List
 
 
+# Defaults for every FTP/SFTP setting; job config values override them
+_FTP_DEFAULTS: Dict[str, Any] = {
+    # Connection settings
+    'host': None,
+    'port': None,  # Depends on connection type, see load_config
+    'user': None,
+    'pass': None,
+    'use_passive_mode': True,
+
+    # File settings
+    'path': '/',
+    'local_download_path': './downloads/',
+
+    # Filtering
+    'pattern': None,
+    'sampleFiles': None,
+    'generateRegex': False,
+    'exclude_pattern': None,
+    'skipPatterns': None,
+    'excludeFolders': None,
+    'extensions': None,
+    'min_size': None,
+    'max_size': None,
+    'last_days': None,
+    'start_date': None,
+    'end_date': None,
+
+    # Sorting
+    'sortByDate': False,
+    'sortByDateInFilename': False,
+    'dateFormatInFilename': '%Y-%m-%d',
+    'sortByDateInPath': False,
+    'dateFormatInPath': '%Y/%m/%d',
+    'getLatestFileOnly': False,
+    'sortFilesByModifiedTime': False,
+    'sortDescending': False,
+    'sortOnFileName': False,
+    'caseSensitive': False,
+    'num_files': None,
+
+    # Extracted date filtering
+    'extractedDateStart': None,
+    'extractedDateEnd': None,
+    'extractedDateLastDays': None,
+    'extractedDateNextDays': None,
+    'includeFilesWithoutDates': False,
+
+    # Download settings
+    'overwrite_existing': False,
+    'appendFullPath': False,
+    'resume_transfer': True,
+    'connection_timeout': 30,
+    'max_reconnect_attempts': 3,
+}
+
+
 class FTPModuleConfig:
     """Configuration class for FTP Module"""
     
@@ -23,60 +79,11 @@ class FTPModuleConfig:
         source_type = job_config.get('source_type', 'ftp').lower()
         conn_type = 'sftp' if source_type in ['sftp', 'ssh'] else 'ftp'
         
-        self.config = {
-            # Connection settings
-            'type': conn_type,
-            'host': job_config.get('host'),
-            'port': job_config.get('port', 22 if conn_type == 'sftp' else 21),
-            'user': job_config.get('user'),
-            'pass': job_config.get('pass'),
-            'use_passive_mode': job_config.get('use_passive_mode', True),
-            
-            # File settings
-            'path': job_config.get('path', '/'),
-            'local_download_path': job_config.get('local_download_path', './downloads/'),
-            
-            # Filtering
-            'pattern': job_config.get('pattern'),
-            'sampleFiles': job_config.get('sampleFiles'),
-            'generateRegex': job_config.get('generateRegex', False),
-            'exclude_pattern': job_config.get('exclude_pattern'),
-            'skipPatterns': job_config.get('skipPatterns'),
-            'excludeFolders': job_config.get('excludeFolders'),
-            'extensions': job_config.get('extensions'),
-            'min_size': job_config.get('min_size'),
-            'max_size': job_config.get('max_size'),
-            'last_days': job_config.get('last_days'),
-            'start_date': job_config.get('start_date'),
-            'end_date': job_config.get('end_date'),
-            
-            # Sorting
-            'sortByDate': job_config.get('sortByDate', False),
-            'sortByDateInFilename': job_config.get('sortByDateInFilename', False),
-            'dateFormatInFilename': job_config.get('dateFormatInFilename', '%Y-%m-%d'),
-            'sortByDateInPath': job_config.get('sortByDateInPath', False),
-            'dateFormatInPath': job_config.get('dateFormatInPath', '%Y/%m/%d'),
-            'getLatestFileOnly': job_config.get('getLatestFileOnly', False),
-            'sortFilesByModifiedTime': job_config.get('sortFilesByModifiedTime', False),
-            'sortDescending': job_config.get('sortDescending', False),
-            'sortOnFileName': job_config.get('sortOnFileName', False),
-            'caseSensitive': job_config.get('caseSensitive', False),
-            'num_files': job_config.get('num_files'),
-            
-            # Extracted date filtering
-            'extractedDateStart': job_config.get('extractedDateStart'),
-            'extractedDateEnd': job_config.get('extractedDateEnd'),
-            'extractedDateLastDays': job_config.get('extractedDateLastDays'),
-            'extractedDateNextDays': job_config.get('extractedDateNextDays'),
-            'includeFilesWithoutDates': job_config.get('includeFilesWithoutDates', False),
-            
-            # Download settings
-            'overwrite_existing': job_config.get('overwrite_existing', False),
-            'appendFullPath': job_config.get('appendFullPath', False),
-            'resume_transfer': job_config.get('resume_transfer', True),
-            'connection_timeout': job_config.get('connection_timeout', 30),
-            'max_reconnect_attempts': job_config.get('max_reconnect_attempts', 3)
-        }
+        # Start from the defaults and override with whatever the job config provides
+        self.config = {'type': conn_type, **_FTP_DEFAULTS}
+        self.config.update((key, job_config[key]) for key in _FTP_DEFAULTS.keys() & job_config.keys())
+        if 'port' not in job_config:
+            self.config['port'] = 22 if conn_type == 'sftp' else 21
         return self.config
     
     def validate_config(self) -> List[str]:
@@ -1,56 +1,65 @@
 """FTP Module Specific Exceptions"""
 import logging
+import re
 from typing import Dict, Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Error-message keywords, found in a single scan. Zero-width lookahead matches at
+# every position, so overlapping keywords ("ftp" in "sftp", "connection" in
+# "data connection") are still reported like plain substring checks would be.
+_FTP_ERROR_KEYWORDS_RE = re.compile(
+    r"(?=(?P<sftp>sftp)|(?P<ftp>ftp)|(?P<ssh>ssh)|(?P<passive>passive mode|pasv)"
+    r"|(?P<data>data connection)|(?P<handshake>handshake|protocol)|(?P<key>key)"
+    r"|(?P<auth>authentication)|(?P<network>timeout|connection|network)"
+    r"|(?P<permission>permission|access denied))"
+)
+
 class FTPModuleException(Exception):
     """Base exception for FTP Module"""
     def __init__(self, message: str, error_code: str = None, context: Dict[str, Any] = None):
         super().__init__(message)
         self.error_code = error_code
         self.context = context or {}
-        logger.error(f"FTPModuleException: {message} (code: {error_code})")
+        # Logged once here for every subclass, with lazy %-formatting
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("%s: %s (code: %s, context: %s)", type(self).__name__, message, error_code, self.context)
 
 class FTPConnectionError(FTPModuleException):
     """FTP connection related errors"""
     def __init__(self, message: str, host: str = None, port: int = None):
         super().__init__(message, "CONNECTION_ERROR", {"host": host, "port": port})
-        logger.error(f"FTP Connection Error - Host: {host}, Port: {port}, Message: {message}")
 
 class FTPDownloadError(FTPModuleException):
     """FTP download related errors"""
     def __init__(self, message: str, remote_path: str = None, local_path: str = None):
         super().__init__(message, "DOWNLOAD_ERROR", {"remote_path": remote_path, "local_path": local_path})
-        logger.error(f"FTP Download Error - Remote: {remote_path}, Local: {local_path}, Message: {message}")
 
 class FTPConfigurationError(FTPModuleException):
     """FTP configuration related errors"""
     def __init__(self, message: str, missing_fields: list = None):
         super().__init__(message, "CONFIG_ERROR", {"missing_fields": missing_fields or []})
-        logger.error(f"FTP Configuration Error - Missing: {missing_fields}, Message: {message}")
 
 class SFTPConnectionError(FTPModuleException):
     """SFTP connection related errors"""
     def __init__(self, message: str, host: str = None, port: int = None):
         super().__init__(message, "SFTP_CONNECTION_ERROR", {"host": host, "port": port})
-        logger.error(f"SFTP Connection Error - Host: {host}, Port: {port}, Message: {message}")
 
 class SFTPDownloadError(FTPModuleException):
     """SFTP download related errors"""
     def __init__(self, message: str, remote_path: str = None, local_path: str = None):
         super().__init__(message, "SFTP_DOWNLOAD_ERROR", {"remote_path": remote_path, "local_path": local_path})
-        logger.error(f"SFTP Download Error - Remote: {remote_path}, Local: {local_path}, Message: {message}")
 
 def handle_ftp_exception(e: Exception, operation: str, **kwargs) -> FTPModuleException:
     """Convert generic exceptions to FTP-specific exceptions"""
     error_str = str(e).lower()
+    keywords = {match.lastgroup for match in _FTP_ERROR_KEYWORDS_RE.finditer(error_str)}
     
     # FTP-specific error handling
-    if 'ftp' in error_str or kwargs.get('protocol') == 'ftp':
-        if 'passive mode' in error_str or 'pasv' in error_str:
+    if 'ftp' in keywords or 'sftp' in keywords or kwargs.get('protocol') == 'ftp':
+        if 'passive' in keywords:
             return FTPConnectionError(f"FTP passive mode failed: {str(e)}", **kwargs)
-        elif 'data connection' in error_str:
+        elif 'data' in keywords:
             return FTPConnectionError(f"FTP data connection failed: {str(e)}", **kwargs)
         elif operation == 'download':
             return FTPDownloadError(f"FTP download failed: {str(e)}", **kwargs)
@@ -58,25 +67,25 @@ def handle_ftp_exception(e: Exception, operation: str, **kwargs) -> FTPModuleExc
             return FTPConnectionError(f"FTP connection failed: {str(e)}", **kwargs)
     
     # SFTP-specific error handling
-    elif 'sftp' in error_str or 'ssh' in error_str or kwargs.get('protocol') == 'sftp':
-        if 'handshake' in error_str or 'protocol' in error_str:
+    elif 'ssh' in keywords or kwargs.get('protocol') == 'sftp':
+        if 'handshake' in keywords:
             return SFTPConnectionError(f"SSH handshake failed: {str(e)}", **kwargs)
-        elif 'key' in error_str and 'authentication' in error_str:
+        elif 'key' in keywords and 'auth' in keywords:
             return SFTPConnectionError(f"SSH key authentication failed: {str(e)}", **kwargs)
         elif operation == 'download':
             return SFTPDownloadError(f"SFTP download failed: {str(e)}", **kwargs)
         elif operation == 'connection':
             return SFTPConnectionError(f"SFTP connection failed: {str(e)}", **kwargs)
     
-    # Network/connection errors
-    if any(keyword in error_str for keyword in ['timeout', 'connection', 'network']):
+    # Network/connection errors ("data connection" also contains "connection")
+    if 'network' in keywords or 'data' in keywords:
         protocol = kwargs.get('protocol', 'FTP/SFTP')
         if protocol == 'sftp':
             return SFTPConnectionError(f"Network error: {str(e)}", **kwargs)
         else:
             return FTPConnectionError(f"Network error: {str(e)}", **kwargs)
     
-    elif 'permission' in error_str or 'access denied' in error_str:
+    elif 'permission' in keywords:
         protocol = kwargs.get('protocol', 'FTP/SFTP')
         if protocol == 'sftp':
             return SFTPConnectionError(f"Permission denied: {str(e)}", **kwargs)
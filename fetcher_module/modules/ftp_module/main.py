@@ -1,14 +1,27 @@
 """FTP Module Implementation - Async Version"""
 
-import os
+import re
 import asyncio
-from typing import Dict, Any, List
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
 from common.interfaces.base_module import BaseModule
+from common.utils.file_utils import find_existing_files
+from common.fetcher_services import run_file_transfer
+from .config import FTPModuleConfig
+
+
+# Accepted download formats, matched case-insensitively at the end of the path
+_VALID_EXTENSION_RE = re.compile(r'\.(?:csv|xml|json|txt)\Z', re.IGNORECASE)
 
 
 class FTPModule(BaseModule):
     """FTP data module implementation"""
     
+    def __init__(self, job_config):
+        super().__init__(job_config)
+        # Loaded and validated transfer config, reused across fetch_data calls (retries)
+        self._transfer_config: Optional[Tuple[Dict[str, Any], List[str]]] = None
+    
     def _get_module_name(self) -> str:
         return "ftp"
     
@@ -22,7 +35,6 @@ class FTPModule(BaseModule):
             # TODO: Initialize actual FTP connection
             # self.ftp_client = ftplib.FTP(self.get_config_value('ftp_host'))
             # self.ftp_client.login(username, password)
-            await asyncio.sleep(0.1)  # Simulate async connection
             self.logger.info("FTP module initialized")
             return True
         except Exception as e:
@@ -32,15 +44,8 @@ class FTPModule(BaseModule):
     async def fetch_data(self) -> Dict[str, Any]:
         """Fetch files from FTP/SFTP server using file transfer services"""
         try:
-            from .config import FTPModuleConfig
-            from common.fetcher_services import run_file_transfer
-            
-            # Load FTP configuration
-            config_loader = FTPModuleConfig(self.job_config.raw_config)
-            config = config_loader.load_config()
-            
-            # Validate configuration
-            errors = config_loader.validate_config()
+            # Load and validate FTP configuration
+            config, errors = self._load_transfer_config()
             if errors:
                 return {"success": False, "error": f"Config validation failed: {errors}", "files_downloaded": []}
             
@@ -53,6 +58,18 @@ class FTPModule(BaseModule):
             ftp_error = handle_ftp_exception(e, "fetch", protocol=config.get('type'))
             return {"success": False, "error": str(ftp_error), "files_downloaded": []}
     
+    def _load_transfer_config(self) -> Tuple[Dict[str, Any], List[str]]:
+        """Load and validate the FTP transfer config once per module instance"""
+        if self._transfer_config is None:
+            config_loader = FTPModuleConfig(self.job_config.raw_config)
+            self._transfer_config = (config_loader.load_config(), config_loader.validate_config())
+        return self._transfer_config
+    
+    @cached_property
+    def upload_folder(self) -> str:
+        """S3 folder validated files are uploaded to; fixed for the module's channel"""
+        return f"data/ftp/ch_{self.channel_number}/validated"
+    
     async def validate_data(self, fetch_result: Dict[str, Any]) -> Dict[str, Any]:
         """Validate FTP files (async)"""
         try:
@@ -63,30 +80,22 @@ class FTPModule(BaseModule):
             # 2. Validate data types
             # 3. Check required columns
             
-            # Simulate async validation
-            await asyncio.sleep(0.1)
-            
             # Simple validation - check file existence and basic format
+            existing_files = await asyncio.to_thread(find_existing_files, files)
             valid_files = []
             invalid_files = []
             
             for f in files:
-                if os.path.exists(f):
-                    # Accept common file formats
-                    if f.endswith(('.csv', '.xml', '.json', '.txt')):
-                        valid_files.append(f)
-                    else:
-                        invalid_files.append(f)
+                if f in existing_files and _VALID_EXTENSION_RE.search(f):
+                    valid_files.append(f)
                 else:
                     invalid_files.append(f)
-            upload_folder = f"data/ftp/ch_{self.channel_number}/validated"
-            
             return {
                 "success": len(valid_files) > 0,
                 "valid_files": valid_files,
                 "invalid_files": invalid_files,
                 "validation_errors": [],
-                "upload_folder": upload_folder
+                "upload_folder": self.upload_folder
             }
         except Exception as e:
             from .exceptions.ftp_exceptions import handle_ftp_exception
@@ -3,6 +3,69 @@
 from typing import Dict, Any, List
 
 
+# Defaults for every S3 setting; job config values override them
+_S3_DEFAULTS: Dict[str, Any] = {
+    # Connection settings
+    'bucket': None,
+    'region': 'us-east-1',
+    'aws_access_key_id': None,
+    'aws_secret_access_key': None,
+    'aws_session_token': None,
+    'profile': None,
+
+    # File settings
+    'path': '/',
+    'local_download_path': './downloads/',
+
+    # Filtering
+    'pattern': None,
+    'sampleFiles': None,
+    'generateRegex': False,
+    'exclude_pattern': None,
+    'skipPatterns': None,
+    'excludeFolders': None,
+    'extensions': None,
+    'min_size': None,
+    'max_size': None,
+    'last_days': None,
+    'start_date': None,
+    'end_date': None,
+
+    # Sorting
+    'sortByDate': False,
+    'sortByDateInFilename': False,
+    'dateFormatInFilename': '%Y-%m-%d',
+    'sortByDateInPath': False,
+    'dateFormatInPath': '%Y/%m/%d',
+    'getLatestFileOnly': False,
+    'sortFilesByModifiedTime': False,
+    'sortDescending': False,
+    'sortOnFileName': False,
+    'caseSensitive': False,
+    'num_files': None,
+
+    # Extracted date filtering
+    'extractedDateStart': None,
+    'extractedDateEnd': None,
+    'extractedDateLastDays': None,
+    'extractedDateNextDays': None,
+    'includeFilesWithoutDates': False,
+
+    # Download settings
+    'overwrite_existing': False,
+    'appendFullPath': False,
+    'resume_transfer': True,
+    'connection_timeout': 60,
+    'max_reconnect_attempts': 3,
+    'max_concurrency': 10,  # Parallel byte-range requests per large object
+    'chunksize': 8 * 1024 * 1024,  # Objects larger than this are fetched in ranges of this size
+}
+
+
+# Credentials that are sufficient on their own (the access key needs its secret)
+_ALTERNATIVE_CREDENTIAL_KEYS = ('profile', 'aws_session_token')
+
+
 class S3ModuleConfig:
     """Configuration class for S3 Module"""
     
@@ -23,61 +86,9 @@ class S3ModuleConfig:
             else:
                 job_config = self.job_config
             
-            self.config = {
-                # Connection settings
-                'type': 's3',
-                'bucket': job_config.get('bucket'),
-                'region': job_config.get('region', 'us-east-1'),
-                'aws_access_key_id': job_config.get('aws_access_key_id'),
-                'aws_secret_access_key': job_config.get('aws_secret_access_key'),
-                'aws_session_token': job_config.get('aws_session_token'),
-                'profile': job_config.get('profile'),
-            
-            # File settings
-            'path': job_config.get('path', '/'),
-            'local_download_path': job_config.get('local_download_path', './downloads/'),
-            
-            # Filtering
-            'pattern': job_config.get('pattern'),
-            'sampleFiles': job_config.get('sampleFiles'),
-            'generateRegex': job_config.get('generateRegex', False),
-            'exclude_pattern': job_config.get('exclude_pattern'),
-            'skipPatterns': job_config.get('skipPatterns'),
-            'excludeFolders': job_config.get('excludeFolders'),
-            'extensions': job_config.get('extensions'),
-            'min_size': job_config.get('min_size'),
-            'max_size': job_config.get('max_size'),
-            'last_days': job_config.get('last_days'),
-            'start_date': job_config.get('start_date'),
-            'end_date': job_config.get('end_date'),
-            
-            # Sorting
-            'sortByDate': job_config.get('sortByDate', False),
-            'sortByDateInFilename': job_config.get('sortByDateInFilename', False),
-            'dateFormatInFilename': job_config.get('dateFormatInFilename', '%Y-%m-%d'),
-            'sortByDateInPath': job_config.get('sortByDateInPath', False),
-            'dateFormatInPath': job_config.get('dateFormatInPath', '%Y/%m/%d'),
-            'getLatestFileOnly': job_config.get('getLatestFileOnly', False),
-            'sortFilesByModifiedTime': job_config.get('sortFilesByModifiedTime', False),
-            'sortDescending': job_config.get('sortDescending', False),
-            'sortOnFileName': job_config.get('sortOnFileName', False),
-            'caseSensitive': job_config.get('caseSensitive', False),
-            'num_files': job_config.get('num_files'),
-            
-            # Extracted date filtering
-            'extractedDateStart': job_config.get('extractedDateStart'),
-            'extractedDateEnd': job_config.get('extractedDateEnd'),
-            'extractedDateLastDays': job_config.get('extractedDateLastDays'),
-            'extractedDateNextDays': job_config.get('extractedDateNextDays'),
-            'includeFilesWithoutDates': job_config.get('includeFilesWithoutDates', False),
-            
-            # Download settings
-            'overwrite_existing': job_config.get('overwrite_existing', False),
-            'appendFullPath': job_config.get('appendFullPath', False),
-            'resume_transfer': job_config.get('resume_transfer', True),
-            'connection_timeout': job_config.get('connection_timeout', 60),
-            'max_reconnect_attempts': job_config.get('max_reconnect_attempts', 3)
-            }
+            # Start from the defaults and override with whatever the job config provides
+            self.config = {'type': 's3', **_S3_DEFAULTS}
+            self.config.update((key, job_config[key]) for key in _S3_DEFAULTS.keys() & job_config.keys())
             return self.config
         
         except Exception as e:
@@ -96,12 +107,9 @@ class S3ModuleConfig:
             if not self.config.get('bucket'):
                 errors.append('S3 bucket is required')
                 
-            # Check credentials
+            # Check credentials: an access key pair, or any single alternative credential
             has_keys = self.config.get('aws_access_key_id') and self.config.get('aws_secret_access_key')
-            has_profile = self.config.get('profile')
-            has_session_token = self.config.get('aws_session_token')
-            
-            if not has_keys and not has_profile and not has_session_token:
+            if not has_keys and not any(self.config.get(key) for key in _ALTERNATIVE_CREDENTIAL_KEYS):
                 errors.append('AWS credentials (keys, profile, or session token) are required')
                 
         except Exception as e:
@@ -1,7 +1,15 @@
 """S3 Module Specific Exceptions"""
 import logging
+import re
 from typing import Dict, Any, Optional
 
+# botocore is optional here; without it only message-based classification is done
+try:
+    from botocore.exceptions import ClientError
+    BOTOCORE_AVAILABLE = True
+except ImportError:
+    BOTOCORE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class S3ModuleException(Exception):
@@ -10,50 +18,57 @@ class S3ModuleException(Exception):
         super().__init__(message)
         self.error_code = error_code
         self.context = context or {}
-        logger.error(f"S3ModuleException: {message} (code: {error_code})")
+        # Logged once here for every subclass, with lazy %-formatting
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("%s: %s (code: %s, context: %s)", type(self).__name__, message, error_code, self.context)
 
 class S3ConnectionError(S3ModuleException):
     """S3 connection related errors"""
     def __init__(self, message: str, bucket: str = None, region: str = None):
         super().__init__(message, "CONNECTION_ERROR", {"bucket": bucket, "region": region})
-        logger.error(f"S3 Connection Error - Bucket: {bucket}, Region: {region}, Message: {message}")
 
 class S3DownloadError(S3ModuleException):
     """S3 download related errors"""
     def __init__(self, message: str, remote_path: str = None, local_path: str = None):
         super().__init__(message, "DOWNLOAD_ERROR", {"remote_path": remote_path, "local_path": local_path})
-        logger.error(f"S3 Download Error - Remote: {remote_path}, Local: {local_path}, Message: {message}")
 
 class S3ConfigurationError(S3ModuleException):
     """S3 configuration related errors"""
     def __init__(self, message: str, missing_fields: list = None):
         super().__init__(message, "CONFIG_ERROR", {"missing_fields": missing_fields or []})
-        logger.error(f"S3 Configuration Error - Missing: {missing_fields}, Message: {message}")
+
+# S3 API error codes -> (exception class, message prefix)
+_S3_ERROR_CODES = {
+    'AccessDenied': (S3ConnectionError, "Authentication failed"),
+    'InvalidAccessKeyId': (S3ConnectionError, "Authentication failed"),
+    'SignatureDoesNotMatch': (S3ConnectionError, "Authentication failed"),
+    'NoSuchBucket': (S3ConnectionError, "Bucket not found"),
+    'BucketNotFound': (S3ConnectionError, "Bucket not found"),
+    'NoSuchKey': (S3DownloadError, "File not found"),
+    'KeyNotFound': (S3DownloadError, "File not found"),
+}
+
+# Error-message keywords, checked in this order (network errors win over permission ones)
+_NETWORK_ERROR_RE = re.compile(r"timeout|connection|network")
+_PERMISSION_ERROR_RE = re.compile(r"permission|access denied")
 
 def handle_s3_exception(e: Exception, operation: str, **kwargs) -> S3ModuleException:
     """Convert generic exceptions to S3-specific exceptions"""
-    try:
-        import botocore.exceptions
-        if isinstance(e, botocore.exceptions.ClientError):
-            error_code = e.response['Error']['Code']
-            error_msg = e.response['Error']['Message']
-            
-            if error_code in ['AccessDenied', 'InvalidAccessKeyId', 'SignatureDoesNotMatch']:
-                return S3ConnectionError(f"Authentication failed: {error_msg}", **kwargs)
-            elif error_code in ['NoSuchBucket', 'BucketNotFound']:
-                return S3ConnectionError(f"Bucket not found: {error_msg}", **kwargs)
-            elif error_code in ['NoSuchKey', 'KeyNotFound']:
-                return S3DownloadError(f"File not found: {error_msg}", **kwargs)
-            else:
-                return S3ModuleException(f"S3 API error ({error_code}): {error_msg}")
-    except ImportError:
-        pass
+    if BOTOCORE_AVAILABLE and isinstance(e, ClientError):
+        error_code = e.response['Error']['Code']
+        error_msg = e.response['Error']['Message']
+        
+        known_error = _S3_ERROR_CODES.get(error_code)
+        if known_error:
+            exception_class, prefix = known_error
+            return exception_class(f"{prefix}: {error_msg}", **kwargs)
+        return S3ModuleException(f"S3 API error ({error_code}): {error_msg}")
     
     # Handle network/connection errors
     error_str = str(e).lower()
-    if any(keyword in error_str for keyword in ['timeout', 'connection', 'network']):
+    if _NETWORK_ERROR_RE.search(error_str):
         return S3ConnectionError(f"Network error: {str(e)}", **kwargs)
-    elif 'permission' in error_str or 'access denied' in error_str:
+    elif _PERMISSION_ERROR_RE.search(error_str):
         return S3ConnectionError(f"Permission denied: {str(e)}", **kwargs)
     elif operation == 'download':
         return S3DownloadError(f"Download failed: {str(e)}", **kwargs)
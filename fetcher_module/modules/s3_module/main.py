@@ -1,14 +1,22 @@
 """S3 Module Implementation - Async Version"""
 
-import os
 import asyncio
-from typing import Dict, Any, List
+from functools import cached_property
+from typing import Dict, Any, List, Optional, Tuple
 from common.interfaces.base_module import BaseModule
+from common.utils.file_utils import find_existing_files
+from common.fetcher_services import run_file_transfer
+from .config import S3ModuleConfig
 
 
 class S3Module(BaseModule):
     """S3 data module implementation"""
     
+    def __init__(self, job_config):
+        super().__init__(job_config)
+        # Loaded and validated transfer config, reused across fetch_data calls (retries)
+        self._transfer_config: Optional[Tuple[Dict[str, Any], List[str]]] = None
+    
     def _get_module_name(self) -> str:
         return "s3"
     
@@ -21,7 +29,6 @@ class S3Module(BaseModule):
         try:
             # TODO: Initialize actual S3 client
             # self.s3_client = boto3.client('s3', region_name=self.get_config_value('region'))
-            await asyncio.sleep(0.1)  # Simulate async initialization
             self.logger.info("S3 module initialized")
             return True
         except Exception as e:
@@ -31,15 +38,8 @@ class S3Module(BaseModule):
     async def fetch_data(self) -> Dict[str, Any]:
         """Fetch files from S3 bucket using file transfer services"""
         try:
-            from .config import S3ModuleConfig
-            from common.fetcher_services import run_file_transfer
-            
-            # Load S3 configuration
-            config_loader = S3ModuleConfig(self.job_config.raw_config)
-            config = config_loader.load_config()
-            
-            # Validate configuration
-            errors = config_loader.validate_config()
+            # Load and validate S3 configuration
+            config, errors = self._load_transfer_config()
             if errors:
                 return {"success": False, "error": f"Config validation failed: {errors}", "files_downloaded": []}
             
@@ -50,6 +50,18 @@ class S3Module(BaseModule):
         except Exception as e:
             return {"success": False, "error": str(e), "files_downloaded": []}
     
+    def _load_transfer_config(self) -> Tuple[Dict[str, Any], List[str]]:
+        """Load and validate the S3 transfer config once per module instance"""
+        if self._transfer_config is None:
+            config_loader = S3ModuleConfig(self.job_config.raw_config)
+            self._transfer_config = (config_loader.load_config(), config_loader.validate_config())
+        return self._transfer_config
+    
+    @cached_property
+    def upload_folder(self) -> str:
+        """S3 folder validated files are uploaded to; fixed for the module's channel"""
+        return f"data/s3/ch_{self.channel_number}/validated"
+    
     async def validate_data(self, fetch_result: Dict[str, Any]) -> Dict[str, Any]:
         """Validate S3 files (async)"""
         try:
@@ -60,23 +72,20 @@ class S3Module(BaseModule):
             # 2. Validate content
             # 3. Check file sizes
             
-            # Simulate async validation
-            await asyncio.sleep(0.2)
-            
             # Simple validation
-            valid_files = [f for f in files if os.path.exists(f)]
-            invalid_files = [f for f in files if not os.path.exists(f)]
+            existing_files = await asyncio.to_thread(find_existing_files, files)
+            valid_files = [f for f in files if f in existing_files]
+            invalid_files = [f for f in files if f not in existing_files]
             
             # Get S3 target bucket from environment config
             target_bucket = self.get_config_value("target_bucket", "default-bucket")
-            upload_folder = f"data/s3/ch_{self.channel_number}/validated"
             
             return {
                 "success": len(valid_files) > 0,
                 "valid_files": valid_files,
                 "invalid_files": invalid_files,
                 "validation_errors": [],
-                "upload_folder": upload_folder
+                "upload_folder": self.upload_folder
             }
         except Exception as e:
             return {
@@ -1,116 +1,129 @@
 """Web Module Configuration - Production-ready web scraping settings"""
 
+import copy
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 
+# This file is at: fetcher_module/modules/web_module/config/web_config.py
+_WEB_MODULE_DIR = Path(__file__).parent.parent
+_PROJECT_ROOT = _WEB_MODULE_DIR.parent.parent
+
+
+# Everything except the path-derived STORAGE section; built once at import and
+# copied per instance since sections are updated in place (see initialize_from_job_config)
+_STATIC_WEB_CONFIG: Dict[str, Any] = {
+    "FLOW": {
+        "flow_type": "web_full_analysis",
+        "available_flows": [
+            "web_full_analysis",
+            "web_single_task",
+            "web_generate_from_existing"
+        ]
+    },
+
+    "WEBSITE": {
+        "target_url": "",
+        "channel_name": "",
+        "login_credentials": None
+    },
+
+    "BEDROCK": {
+        "model_id": "arn:aws:bedrock:us-east-1:536697239187:application-inference-profile/6d1roc10vvuc"
+    },
+
+    "LLM": {
+        "temperature": 0.2,
+        "max_tokens": 15000,
+        "top_p": 0.9
+    },
+
+    "BROWSER": {
+        "headless": False,
+        "timeout": 30000,
+        "highlight_elements": False,
+        "anonymized_telemetry": False,
+        "logging_level": "info",
+        "profile_name": "tv_analyzer_temp",
+        "profile_cleanup": True,
+        "use_vision": True,
+        # Independent intelligence tasks run at once; tasks share one page, so keep 1
+        # unless each task gets its own browser context
+        "max_concurrent_tasks": 1
+    },
+
+    "RECORDING": {
+        "har_recording_mode": "global_traditional",
+        "enable_global_video_recording": True,
+        "video_recording_quality": "medium",
+        "enable_global_trace_recording": False,
+        "gif_recording_mode": "task",
+        "gif_recording_enabled": True
+    },
+
+    "TASKS": {
+        "task_0_login_authentication": {
+            "timeout_seconds": 500,
+            "max_steps": 30
+        },
+        "task_1_channel_detection": {
+            "timeout_seconds": 1000,
+            "max_steps": 30
+        },
+        "task_2_date_navigation": {
+            "timeout_seconds": 1000,
+            "max_steps": 30
+        },
+        "task_3_program_extraction": {
+            "timeout_seconds": 1000,
+            "max_steps": 30
+        }
+    },
+
+    "WAIT_TIMES": {
+        "short_wait": 500,
+        "medium_wait": 1000,
+        "long_wait": 2000,
+        "extra_long_wait": 5000
+    },
+
+    "UI": {
+        "regular_font_size": 36,
+        "title_font_size": 48,
+        "goal_font_size": 40
+    },
+
+    "HTTP": {
+        "read_timeout": 600,
+        "connect_timeout": 60
+    }
+}
+
+
 class WebModuleConfig:
     """Configuration class for web scraping specific settings"""
     
     def __init__(self):
-        self._project_root = self._get_project_root()
+        # fetcher_module root directory, resolved once at import
+        self._project_root = _PROJECT_ROOT
         self.config = self._load_web_config()
         self.job_config_data = {}
     
-    def _get_project_root(self) -> Path:
-        """Get project root directory using module path"""
-        # Get the fetcher_module root directory
-        # This file is at: fetcher_module/modules/web_module/config/web_config.py
-        # So go up 3 levels to get to fetcher_module
-        return Path(__file__).parent.parent.parent.parent
-    
     def _load_web_config(self) -> Dict[str, Any]:
         """Load web scraping specific configuration"""
-        web_module_dir = Path(__file__).parent.parent
-        
-        return {
-            "FLOW": {
-                "flow_type": "web_full_analysis",
-                "available_flows": [
-                    "web_full_analysis",
-                    "web_single_task",
-                    "web_generate_from_existing"
-                ]
-            },
-            
-            "WEBSITE": {
-                "target_url": "",
-                "channel_name": "",
-                "login_credentials": None
-            },
-            
-            "BEDROCK": {
-                "model_id": "arn:aws:bedrock:us-east-1:536697239187:application-inference-profile/6d1roc10vvuc"
-            },
-            
-            "LLM": {
-                "temperature": 0.2,
-                "max_tokens": 15000,
-                "top_p": 0.9
-            },
-            
-            "BROWSER": {
-                "headless": False,
-                "timeout": 30000,
-                "highlight_elements": False,
-                "anonymized_telemetry": False,
-                "logging_level": "info",
-                "profile_name": "tv_analyzer_temp",
-                "profile_cleanup": True,
-                "use_vision": True
-            },
-            
-            "STORAGE": {
-                "output_dir": str(web_module_dir / "output"),
-                "prompts_dir": str(self._project_root / "prompts" / "global" / "web")
-            },
-            
-            "RECORDING": {
-                "har_recording_mode": "global_traditional",
-                "enable_global_video_recording": True,
-                "video_recording_quality": "medium",
-                "enable_global_trace_recording": False,
-                "gif_recording_mode": "task",
-                "gif_recording_enabled": True
-            },
-            
-            "TASKS": {
-                "task_0_login_authentication": {
-                    "timeout_seconds": 500,
-                    "max_steps": 30
-                },
-                "task_1_channel_detection": {
-                    "timeout_seconds": 1000,
-                    "max_steps": 30
-                },
-                "task_2_date_navigation": {
-                    "timeout_seconds": 1000,
-                    "max_steps": 30
-                },
-                "task_3_program_extraction": {
-                    "timeout_seconds": 1000,
-                    "max_steps": 30
-                }
-            },
-            
-            "WAIT_TIMES": {
-                "short_wait": 500,
-                "medium_wait": 1000,
-                "long_wait": 2000,
-                "extra_long_wait": 5000
-            },
-            
-            "UI": {
-                "regular_font_size": 36,
-                "title_font_size": 48,
-                "goal_font_size": 40
-            },
-            
-            "HTTP": {
-                "read_timeout": 600,
-                "connect_timeout": 60
-            }
+        storage = {
+            "output_dir": str(_WEB_MODULE_DIR / "output"),
+            "prompts_dir": str(_PROJECT_ROOT / "prompts" / "global" / "web")
         }
+        
+        # Deep copy so no instance shares a mutable section (or list) with another;
+        # STORAGE goes back in after BROWSER to keep the serialized key order
+        config = {}
+        for section, values in copy.deepcopy(_STATIC_WEB_CONFIG).items():
+            config[section] = values
+            if section == "BROWSER":
+                config["STORAGE"] = storage
+        return config
     
     def initialize_from_job_config(self, job_config) -> None:
         """Initialize configuration from job_config"""
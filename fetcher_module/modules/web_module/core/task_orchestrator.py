@@ -1,11 +1,11 @@
 """Task Orchestrator - Main coordinator for TV schedule analysis workflow"""
 
 import asyncio
-import glob
 import json
 import tempfile
 import importlib.util
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
@@ -15,6 +15,16 @@ from ..services.browser_service import BrowserService
 from ..services.intelligence_extractor import IntelligenceExtractor
 from ..config.web_config import web_config
 
+
+@lru_cache(maxsize=64)
+def _read_prompt(path_str: str) -> Optional[str]:
+    """Read a prompt template once per process, or None if the file does not exist"""
+    prompt_file = Path(path_str)
+    if not prompt_file.is_file():
+        return None
+    return prompt_file.read_text(encoding='utf-8')
+
+
 class TaskOrchestrator:
     """Main coordinator for task-based TV schedule analysis"""
     
@@ -30,6 +40,8 @@ class TaskOrchestrator:
         
         # Import web_config directly - always gets updated data
         self.web_config = web_config
+        self._prompts_dir = Path(self.web_config.get_prompts_dir()) / 'code_generation'
+        self._conversational_prompt_index = self._index_conversational_prompts()
         # Create session directory in web module output
         output_dir = Path(self.web_config.get_config()["STORAGE"]["output_dir"])
         self.session_dir = output_dir / f"session_{self.session_id}"
@@ -93,25 +105,29 @@ class TaskOrchestrator:
             if self.login_credentials:
                 self.logger.info("🔐 Login credentials provided - authentication will be performed first")
             
-            for task_def in task_definitions:
-                self.logger.info(f"Executing intelligence task: {task_def.task_id}")
-                
-                # Execute individual task
-                task_result = await self._execute_single_task(
-                    task_definition=task_def,
-                    target_url=target_url,
-                    channel_name=channel_name
-                )
+            # Tasks run in dependency waves: every task whose dependencies have finished
+            # runs concurrently with the others in its wave (bounded by the browser's
+            # max_concurrent_tasks), and its intelligence is accumulated before the
+            # next wave starts, since later tasks build on it
+            for wave in self._get_task_waves(task_definitions):
+                task_results = await self._execute_task_wave(wave, target_url, channel_name)
                 
-                # Store task result
-                self.task_results[task_def.task_id] = task_result
-                self.analysis_session.task_results.append(task_result)
+                successful_results = []
+                for task_def, task_result in zip(wave, task_results):
+                    # Store task result
+                    self.task_results[task_def.task_id] = task_result
+                    self.analysis_session.task_results.append(task_result)
+                    
+                    if task_result.is_successful:
+                        successful_results.append(task_result)
+                    else:
+                        self.logger.warning(f"Task {task_def.task_id} failed, continuing with next task")
                 
-                # Extract intelligence from task result (with HTML + screenshot)
-                if task_result.is_successful:
-                    await self._extract_and_accumulate_intelligence(task_result, target_url, channel_name)
-                else:
-                    self.logger.warning(f"Task {task_def.task_id} failed, continuing with next task")
+                # Extract intelligence from task results (with HTML + screenshot)
+                await asyncio.gather(*(
+                    self._extract_and_accumulate_intelligence(task_result, target_url, channel_name)
+                    for task_result in successful_results
+                ))
             
             # 🆕 NEW: Save global HAR immediately after intelligence gathering
             self.logger.info("🌐 PHASE 1 COMPLETE: Saving global HAR after intelligence gathering")
@@ -161,6 +177,59 @@ class TaskOrchestrator:
         """Cleanup resources"""
         await self.browser_service.close()
     
+    def _get_task_waves(self, task_definitions: List[TaskDefinition]) -> List[List[TaskDefinition]]:
+        """
+        Group tasks into waves that can run concurrently, in dependency order
+        
+        A task joins the first wave after all of its dependencies. Dependencies are
+        ordering only: a failed task still unblocks its dependents, as the workflow
+        continues past failures. Dependencies on tasks not in the list are ignored.
+        """
+        task_ids = {task_def.task_id for task_def in task_definitions}
+        pending = list(task_definitions)
+        done = set()
+        waves = []
+        
+        while pending:
+            wave = [task_def for task_def in pending
+                    if all(dep in done or dep not in task_ids for dep in task_def.dependencies)]
+            if not wave:
+                raise ValueError(f"Circular task dependencies: {[task_def.task_id for task_def in pending]}")
+            
+            waves.append(wave)
+            done.update(task_def.task_id for task_def in wave)
+            pending = [task_def for task_def in pending if task_def.task_id not in done]
+        
+        return waves
+    
+    async def _execute_task_wave(
+        self,
+        wave: List[TaskDefinition],
+        target_url: str,
+        channel_name: str
+    ) -> List[TaskResult]:
+        """Execute independent tasks concurrently, returning results in wave order"""
+        # Tasks drive the shared browser page, so concurrency is opt-in via config
+        max_concurrent_tasks = self.web_config.get_config()["BROWSER"].get("max_concurrent_tasks", 1)
+        semaphore = asyncio.Semaphore(max(1, int(max_concurrent_tasks)))
+        
+        async def run_task(task_def: TaskDefinition) -> TaskResult:
+            async with semaphore:
+                self.logger.info(f"Executing intelligence task: {task_def.task_id}")
+                return await self._execute_single_task(
+                    task_definition=task_def,
+                    target_url=target_url,
+                    channel_name=channel_name
+                )
+        
+        results = await asyncio.gather(*(run_task(task_def) for task_def in wave), return_exceptions=True)
+        
+        # Let the whole wave settle, then fail the analysis as a sequential run would
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+    
     def _get_intelligence_task_definitions(self) -> List[TaskDefinition]:
         """Get task definitions for intelligence gathering (including optional login)"""
         from ..models.task_models import TaskType
@@ -414,12 +483,8 @@ class TaskOrchestrator:
         """Initialize conversation with iterative system prompt"""
         try:
             # Load iterative system prompt
-            prompts_dir = Path(self.web_config.get_prompts_dir()) / 'code_generation'
-            system_prompt_file = prompts_dir / "iterative_system_prompt.txt"
-            
-            if system_prompt_file.exists():
-                system_prompt = system_prompt_file.read_text(encoding='utf-8')
-            else:
+            system_prompt = _read_prompt(str(self._prompts_dir / "iterative_system_prompt.txt"))
+            if system_prompt is None:
                 # Fallback system prompt
                 system_prompt = """You are a Senior Python Developer building a production-ready TV schedule scraper through an iterative step-by-step process. 
                 Generate clean, production-ready code based on intelligence data. Build upon previous steps in our conversation."""
@@ -437,8 +502,6 @@ class TaskOrchestrator:
     
     def _load_iterative_step_prompt(self, step_number: int, step_type: str) -> Optional[str]:
         """Load iterative step-specific code generation prompt"""
-        prompts_dir = Path(self.web_config.get_prompts_dir()) / 'code_generation'
-        
         # Map step types to prompt files
         prompt_files = {
             "login": f"iterative_step_{step_number}_login.txt",
@@ -447,11 +510,12 @@ class TaskOrchestrator:
             "program": f"iterative_step_{step_number}_program.txt"
         }
         
-        prompt_file = prompts_dir / prompt_files.get(step_type, f"iterative_step_{step_number}_{step_type}.txt")
+        prompt_file = self._prompts_dir / prompt_files.get(step_type, f"iterative_step_{step_number}_{step_type}.txt")
         
         try:
-            if prompt_file.exists():
-                return prompt_file.read_text(encoding='utf-8')
+            prompt_template = _read_prompt(str(prompt_file))
+            if prompt_template is not None:
+                return prompt_template
             else:
                 self.logger.warning(f"Iterative prompt file not found: {prompt_file}")
                 # Fallback to conversational prompt if iterative not available
@@ -460,17 +524,23 @@ class TaskOrchestrator:
             self.logger.error(f"Error loading iterative prompt: {e}")
             return None
     
+    def _index_conversational_prompts(self) -> Dict[int, Path]:
+        """Map step numbers to conversational_step_<n>_*.txt prompt files, scanning the directory once"""
+        index: Dict[int, Path] = {}
+        for prompt_file in sorted(self._prompts_dir.glob("conversational_step_*_*.txt")):
+            step = prompt_file.name[len("conversational_step_"):].split("_", 1)[0]
+            if step.isdigit():
+                index.setdefault(int(step), prompt_file)
+        return index
+    
     def _load_conversational_step_prompt_fallback(self, step_number: int) -> Optional[str]:
         """Fallback to existing conversational prompts"""
-        prompts_dir = Path(self.web_config.get_prompts_dir()) / 'code_generation'
-        
         # Find matching conversational prompt
-        pattern = str(prompts_dir / f"conversational_step_{step_number}_*.txt")
-        matching_files = glob.glob(pattern)
+        prompt_file = self._conversational_prompt_index.get(step_number)
         
-        if matching_files:
+        if prompt_file:
             try:
-                return Path(matching_files[0]).read_text(encoding='utf-8')
+                return _read_prompt(str(prompt_file))
             except Exception as e:
                 self.logger.error(f"Error loading fallback prompt: {e}")
         
@@ -606,14 +676,11 @@ class TaskOrchestrator:
         try:
             # Load fix generation prompt
             prompts_dir = Path(self.web_config.get_prompts_dir()) / 'code_fixing'
-            fix_prompt_file = prompts_dir / "fix_generation.txt"
-            
-            if not fix_prompt_file.exists():
+            prompt_template = _read_prompt(str(prompts_dir / "fix_generation.txt"))
+            if prompt_template is None:
                 self.logger.error("Fix generation prompt not found")
                 return None
             
-            prompt_template = fix_prompt_file.read_text(encoding='utf-8')
-            
             # Get intelligence data for this step
             task_id_map = {
                 "login": "task_0_login_authentication",
@@ -648,8 +715,10 @@ class TaskOrchestrator:
             from langchain_core.messages import HumanMessage
             human_message = HumanMessage(content=formatted_prompt)
             
+            # Streams on the event loop instead of blocking it for the whole LLM call
             self.logger.info(f"🤖 Generating fix for {step_type} attempt {attempt_number}...")
-            fixed_code = code_generator.llm_service.stream_response(
+            fixed_code = await code_generator.llm_service.astream_response(
+                llm=code_generator.llm,
                 messages=[human_message],
                 print_response=True
             )